@@ -9,24 +9,30 @@ into SQLite database operations using tool-calling capabilities.
 """
 
 # Standard library imports
+import asyncio
+import html
+import threading
 from datetime import datetime
-from typing import List
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Dict, Iterator, List, Optional, Tuple, TypeVar, Union
 
 # Third-party imports
 import groq
+import orjson
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage, ToolMessage
+from langchain_core.messages.tool import ToolCall
 
 # Local application imports
-from Querymind.logging import green_border_style, log_panel
-from Querymind.tools import call_tool
+from Querymind.logging import green_border_style, log, log_panel
+from Querymind.tools import _database_cache_key, _describe_table_cached, _list_tables_cached, call_tool
 from Querymind.config import Config
 
 # Initialize Groq client with API key from configuration
 client = groq.Groq(api_key=Config.GROQ_API_KEY)
 
 # System prompt that defines the agent's persona and behavior
-SYSTEM_PROMPT = f"""
+_SYSTEM_PROMPT_TEMPLATE = """
 You are QueryMind, an elite database engineer and data analyst with exceptional expertise in database management, SQL query construction and optimization.
 You possess deep knowledge of database concepts, architectures, and best practices across various database systems with specialized focus on SQLite.
 Your purpose is to transform natural language requests into precise, efficient SQL queries that deliver exactly what the user needs.
@@ -48,14 +54,179 @@ You directly show database tables if user ask for it first.
     <instruction>For every tool call, include a detailed reasoning parameter explaining your strategic thinking.</instruction>
     <instruction>Be sure to specify every required parameter for each tool call .< /instruction>
     <instruction>Show appropiate plots if user ask for it for analysis.</instruction>
+    <instruction>The execute_sql tool returns a JSON object with a "columns" list and a "rows" array holding one array of values per row.</instruction>
 </instructions>
 
-Today is {datetime.now().strftime("%Y-%m-%d")}
+Today is {today}
 
 Your responses should be formatted as Markdown. Prefer using tables or lists for displaying data where appropriate.lists for sequential information, and code blocks with SQL syntax highlighting for queries also highlighting necessary/important key words.
 Your target audience is business users who may not be familiar with SQL syntax,data analysts, database administrators, and developers with varying levels of SQL expertise.
 """.strip()
 
+# Databases with more tables than this keep the generic prompt instead of an inlined schema
+MAX_INLINED_TABLES = 50
+
+# Planner instructions used by plan_and_execute() to obtain a DAG of tool calls
+PLANNER_PROMPT = """
+Before answering, plan every database tool call you need for the user's request as a dependency graph.
+Respond with a single JSON object and nothing else, in this format:
+{"nodes": [{"id": "1", "tool": "<tool name>", "args": {<tool arguments including reasoning>}, "deps": []}]}
+Available tools: list_tables, describe_table, sample_table, execute_sql.
+List in "deps" the ids of the nodes whose results a node relies on; nodes without dependencies run in parallel.
+If the request needs no database access, respond with {"nodes": []}.
+""".strip()
+
+# Event loop shared by the synchronous entry points, see _event_loop()
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+# Marks the end of an async generator driven from another thread, see ask_stream()
+_END_OF_STREAM = object()
+
+# Yielded by ask_stream() and ask_stream_async() when the text streamed so far was
+# commentary of a turn that goes on to call tools; consumers discard that text
+STREAM_RESET = object()
+
+T = TypeVar("T")
+
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the event loop that runs the agent for synchronous callers, starting it on first use.
+    
+    The loop runs for the lifetime of the process in a daemon thread. Chat models are
+    cached for the whole process and their async HTTP clients keep pooled connections
+    bound to the loop that opened them, so every call has to go through the same loop;
+    a loop per call would leave the next call with dead connections.
+    
+    Returns:
+        asyncio.AbstractEventLoop: The running shared event loop
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="querymind-agent-loop", daemon=True).start()
+        return _loop
+
+
+def _run(awaitable: Awaitable[T]) -> T:
+    """
+    Run an awaitable on the shared event loop and wait for its result.
+    
+    Args:
+        awaitable (Awaitable[T]): The coroutine or awaitable to run
+        
+    Returns:
+        T: The result of the awaitable
+    """
+    async def wrapper() -> T:
+        return await awaitable
+    return asyncio.run_coroutine_threadsafe(wrapper(), _event_loop()).result()
+
+
+async def _next_chunk(chunks: AsyncIterator[str]) -> Any:
+    """
+    Await the next item of an async iterator, returning _END_OF_STREAM once it is exhausted.
+    """
+    try:
+        return await chunks.__anext__()
+    except StopAsyncIteration:
+        return _END_OF_STREAM
+
+
+def get_system_prompt(date_str: Optional[str] = None) -> str:
+    """
+    Render the system prompt for a given date.
+    
+    Args:
+        date_str (Optional[str]): Date to embed as YYYY-MM-DD. Defaults to today
+        
+    Returns:
+        str: The system prompt
+    """
+    return _SYSTEM_PROMPT_TEMPLATE.format(today=date_str or datetime.now().strftime("%Y-%m-%d"))
+
+
+@lru_cache(maxsize=1)
+def _system_message_for(date_str: str) -> SystemMessage:
+    """
+    Build the system message for a date; the single cache slot holds the current day.
+    
+    Args:
+        date_str (str): Date to embed as YYYY-MM-DD
+        
+    Returns:
+        SystemMessage: The system message shared by all histories of that day
+    """
+    return SystemMessage(content=get_system_prompt(date_str))
+
+
+def _system_message() -> SystemMessage:
+    """
+    Return the shared system message for today, building it on first use.
+    
+    Returns:
+        SystemMessage: The system message for the current day
+    """
+    return _system_message_for(datetime.now().strftime("%Y-%m-%d"))
+
+
+@lru_cache(maxsize=32)
+def _specialized_system_message(db_path: str, mtime: float, system_prompt: str) -> SystemMessage:
+    """
+    Build the system message with the schema of a database inlined, cached per file version.
+    
+    Inlining the schema saves the exploratory list_tables/describe_table turns at the
+    start of most queries. Databases with more than MAX_INLINED_TABLES tables keep the
+    generic prompt.
+    
+    Args:
+        db_path (str): Path of the database file (cache key)
+        mtime (float): Modification time of the database file (cache key)
+        system_prompt (str): The generic system prompt to extend
+        
+    Returns:
+        SystemMessage: The specialized system message, or the generic one for large schemas
+    """
+    tables = _list_tables_cached(db_path, mtime)
+    if not tables or len(tables) > MAX_INLINED_TABLES:
+        return SystemMessage(content=system_prompt)
+
+    schema = "\n".join(
+        f'    <table name="{html.escape(table)}">\n{_describe_table_cached(db_path, mtime, table)}\n    </table>'
+        for table in tables
+    )
+    return SystemMessage(content=(
+        f"{system_prompt}\n\n"
+        "The schema of the connected database is listed below as PRAGMA table_info rows "
+        "(cid, name, type, notnull, dflt_value, pk). Use it directly instead of calling "
+        "list_tables or describe_table for these tables.\n"
+        f"<known_schema>\n{schema}\n</known_schema>"
+    ))
+
+
+def _prepare_messages(query: str, history: List[BaseMessage]) -> List[BaseMessage]:
+    """
+    Copy the history, specialize its system message for the database and append the query.
+    
+    Args:
+        query (str): The user's natural language query
+        history (List[BaseMessage]): The conversation history
+        
+    Returns:
+        List[BaseMessage]: The messages to send to the LLM
+    """
+    messages = history.copy()
+    if messages and isinstance(messages[0], SystemMessage):
+        try:
+            messages[0] = _specialized_system_message(*_database_cache_key(), messages[0].content)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log(f"[red]Error reading schema for the system prompt: {str(e)}[/red]")
+    messages.append(HumanMessage(content=query))
+    return messages
+
 
 def create_history() -> List[BaseMessage]:
     """
@@ -64,7 +235,7 @@ def create_history() -> List[BaseMessage]:
     Returns:
         List[BaseMessage]: A list containing the system message
     """
-    return [SystemMessage(content=SYSTEM_PROMPT)]
+    return [_system_message()]
 
 
 def ask(
@@ -73,8 +244,34 @@ def ask(
     """
     Process a user query through the LLM agent with tool-calling capability.
     
+    Synchronous entry point that runs ask_async() on the shared event loop
+    (see _event_loop()), for callers such as the Streamlit script that are not async.
+    
+    Args:
+        query (str): The user's natural language query
+        history (List[BaseMessage]): The conversation history
+        llm (BaseChatModel): The language model to use
+        max_iterations (int): Maximum number of tool-calling iterations before timing out
+        
+    Returns:
+        str: The final response content from the LLM
+        
+    Raises:
+        RuntimeError: If max_iterations is reached without a final response
+    """
+    return _run(ask_async(query, history, llm, max_iterations))
+
+
+async def ask_async(
+    query: str, history: List[BaseMessage], llm: BaseChatModel, max_iterations: int = 10
+) -> str:
+    """
+    Process a user query through the LLM agent with tool-calling capability.
+    
     This function manages the conversation loop with the LLM, allowing it to make tool calls
     to explore the database and construct SQL queries before providing a final response.
+    LLM requests go through the async client and the tool calls of each turn run
+    concurrently in worker threads.
     
     Args:
         query (str): The user's natural language query
@@ -90,26 +287,373 @@ def ask(
     """
     log_panel(title="User Request", content=f"Query: {query}", border_style=green_border_style)
 
+    if Config.USE_COMPILER:
+        return await plan_and_execute(query, history, llm, max_iterations)
+
+    messages = _prepare_messages(query, history)
+    return await _run_agent_loop(messages, llm, max_iterations)
+
+
+def ask_stream(
+    query: str, history: List[BaseMessage], llm: BaseChatModel, max_iterations: int = 10
+) -> Iterator[Union[str, object]]:
+    """
+    Process a user query like ask(), yielding the final answer as it is generated.
+    
+    Synchronous wrapper that drives ask_stream_async() on the shared event loop
+    (see _event_loop()), for the Streamlit script.
+    
+    Args:
+        query (str): The user's natural language query
+        history (List[BaseMessage]): The conversation history
+        llm (BaseChatModel): The language model to use
+        max_iterations (int): Maximum number of tool-calling iterations before timing out
+        
+    Yields:
+        Union[str, object]: Chunks of the final response content, or STREAM_RESET,
+                            see ask_stream_async()
+        
+    Raises:
+        RuntimeError: If max_iterations is reached without a final response
+    """
+    chunks = ask_stream_async(query, history, llm, max_iterations)
+    try:
+        while True:
+            chunk = _run(_next_chunk(chunks))
+            if chunk is _END_OF_STREAM:
+                return
+            yield chunk
+    finally:
+        _run(chunks.aclose())
+
+
+async def ask_stream_async(
+    query: str, history: List[BaseMessage], llm: BaseChatModel, max_iterations: int = 10
+) -> AsyncIterator[Union[str, object]]:
+    """
+    Process a user query like ask_async(), yielding the final answer as it is generated.
+    
+    Each LLM turn is streamed; turns that request tool calls are accumulated and
+    their tools executed as in ask_async(), and text is yielded chunk by chunk as it
+    arrives. Models stream commentary such as "Let me look at the tables." before
+    the tool call deltas of a turn; that text is not part of the answer ask_async()
+    returns, so once a turn turns out to call tools STREAM_RESET is yielded and the
+    consumer discards everything received since the previous reset. The text
+    received after the last reset is the answer. With Config.USE_COMPILER the
+    planner's answer is yielded as a single chunk.
+    
+    Args:
+        query (str): The user's natural language query
+        history (List[BaseMessage]): The conversation history
+        llm (BaseChatModel): The language model to use
+        max_iterations (int): Maximum number of tool-calling iterations before timing out
+        
+    Yields:
+        Union[str, object]: Chunks of the final response content, or STREAM_RESET
+        
+    Raises:
+        RuntimeError: If max_iterations is reached without a final response
+    """
+    log_panel(title="User Request", content=f"Query: {query}", border_style=green_border_style)
+
+    if Config.USE_COMPILER:
+        yield await plan_and_execute(query, history, llm, max_iterations)
+        return
+
+    messages = _prepare_messages(query, history)
+    seen = {}
+
+    for _ in range(max_iterations):
+        response = None
+        streamed = False
+        reset = False
+        async for chunk in llm.astream(messages):
+            response = chunk if response is None else response + chunk
+            if response.tool_call_chunks:
+                # Text of a turn that turns out to call tools is not part of the answer
+                if streamed and not reset:
+                    yield STREAM_RESET
+                    reset = True
+            elif chunk.content:
+                yield chunk.content
+                streamed = True
+        messages.append(response)
+
+        if not response.tool_calls:
+            # Tool call deltas that did not parse into a call leave a plain answer
+            if reset and response.content:
+                yield response.content
+            return
+
+        messages.extend(await _execute_tool_calls(response.tool_calls, seen))
+
+    raise RuntimeError(
+        "Maximum number of iterations reached. Please try again with a different query."
+    )
+
+
+async def _run_agent_loop(
+    messages: List[BaseMessage],
+    llm: BaseChatModel,
+    max_iterations: int,
+    seen: Optional[Dict[Tuple[str, str], str]] = None,
+) -> str:
+    """
+    Run the ReAct loop: invoke the LLM and execute its tool calls until it answers.
+    
+    Args:
+        messages (List[BaseMessage]): The messages to send, extended in place
+        llm (BaseChatModel): The language model to use
+        max_iterations (int): Maximum number of tool-calling iterations before timing out
+        seen (Optional[Dict[Tuple[str, str], str]]): Results of tool calls already made
+                                                     for this query, see _execute_tool_calls()
+        
+    Returns:
+        str: The final response content from the LLM
+        
+    Raises:
+        RuntimeError: If max_iterations is reached without a final response
+    """
     n_iterations = 0
-    messages = history.copy()
-    messages.append(HumanMessage(content=query))
+    seen = {} if seen is None else seen
 
     while n_iterations < max_iterations:
         # Get response from LLM
-        response = llm.invoke(messages)
+        response = await llm.ainvoke(messages)
         messages.append(response)
         
         # If no tool calls are made, return the final response
         if not response.tool_calls:
             return response.content
         
-        # Process each tool call and add the results to the conversation
-        for tool_call in response.tool_calls:
-            response = call_tool(tool_call) # Execute the requested tool
-            messages.append(response) # Add the tool response to the conversation
+        messages.extend(await _execute_tool_calls(response.tool_calls, seen))
         
         n_iterations += 1
 
     raise RuntimeError(
         "Maximum number of iterations reached. Please try again with a different query."
-    )
\ No newline at end of file
+    )
+
+
+def _tool_call_key(name: str, args: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Build the memoization key of a tool call.
+    
+    The free-text reasoning argument is ignored, as it differs between otherwise
+    identical calls.
+    
+    Args:
+        name (str): Name of the tool
+        args (Dict[str, Any]): Arguments of the tool call
+        
+    Returns:
+        Tuple[str, str]: The tool name and its canonical JSON-encoded arguments
+    """
+    args = {key: value for key, value in args.items() if key != "reasoning"}
+    return name, orjson.dumps(args, option=orjson.OPT_SORT_KEYS).decode()
+
+
+async def _execute_tool_calls(
+    tool_calls: List[ToolCall], seen: Dict[Tuple[str, str], str]
+) -> List[ToolMessage]:
+    """
+    Execute the tool calls of one LLM turn concurrently, skipping repeated calls.
+    
+    A call whose tool and arguments match an earlier call of the same query is not
+    executed again; the earlier result is returned with a note, which also keeps a
+    model that repeats itself from burning iterations on SQLite traffic.
+    
+    Args:
+        tool_calls (List[ToolCall]): Tool calls emitted by the LLM
+        seen (Dict[Tuple[str, str], str]): Results of earlier calls, updated in place
+        
+    Returns:
+        List[ToolMessage]: One message per tool call, in the order of tool_calls
+    """
+    keys = [_tool_call_key(tool_call["name"], tool_call["args"]) for tool_call in tool_calls]
+    repeated = {key for key in keys if key in seen}
+
+    pending = {}
+    for key, tool_call in zip(keys, tool_calls):
+        if key not in seen and key not in pending:
+            pending[key] = tool_call
+
+    # gather() keeps the results in submission order, matching them to their keys
+    results = await asyncio.gather(
+        *(asyncio.to_thread(call_tool, tool_call) for tool_call in pending.values())
+    )
+    for key, result in zip(pending, results):
+        seen[key] = result.content
+
+    return [
+        ToolMessage(
+            content=(
+                "This tool was already called with the same arguments; its result was:\n" + seen[key]
+                if key in repeated else seen[key]
+            ),
+            tool_call_id=tool_call["id"],
+        )
+        for key, tool_call in zip(keys, tool_calls)
+    ]
+
+
+async def plan_and_execute(
+    query: str, history: List[BaseMessage], llm: BaseChatModel, max_iterations: int = 10
+) -> str:
+    """
+    Process a user query by planning all tool calls first and executing them as a DAG.
+    
+    The LLM is asked once for a JSON graph of tool calls. Nodes are executed generation
+    by generation, each generation concurrently, and the observations are handed back to
+    the LLM, which then answers or continues with regular tool calls. If the LLM does not
+    return a usable plan, the query falls back to the ReAct loop.
+    
+    Args:
+        query (str): The user's natural language query
+        history (List[BaseMessage]): The conversation history
+        llm (BaseChatModel): The language model to use
+        max_iterations (int): Maximum number of LLM calls after the planning call
+        
+    Returns:
+        str: The final response content from the LLM
+        
+    Raises:
+        RuntimeError: If max_iterations is reached without a final response
+    """
+    messages = _prepare_messages(query, history)
+
+    response = await llm.ainvoke(
+        messages[:-1] + [SystemMessage(content=PLANNER_PROMPT)] + messages[-1:]
+    )
+
+    seen = {}
+
+    # The model may ignore the planner format and call tools directly
+    if response.tool_calls:
+        messages.append(response)
+        messages.extend(await _execute_tool_calls(response.tool_calls, seen))
+        return await _run_agent_loop(messages, llm, max_iterations, seen)
+
+    try:
+        nodes = _parse_plan(response.content)
+        generations = _topological_generations(nodes)
+    except ValueError as e:
+        log_panel(title="Planner", content=f"Unusable plan, falling back to tool calling: {str(e)}")
+        return await _run_agent_loop(messages, llm, max_iterations)
+
+    if not nodes:
+        return await _run_agent_loop(messages, llm, max_iterations)
+
+    observations = []
+    for generation in generations:
+        results = await asyncio.gather(
+            *(asyncio.to_thread(_run_plan_node, node) for node in generation)
+        )
+        for node, result in zip(generation, results):
+            seen[_tool_call_key(node["tool"], node["args"])] = result
+        observations.extend(
+            f"[{node['id']}] {node['tool']}({orjson.dumps(node['args']).decode()}):\n{result}"
+            for node, result in zip(generation, results)
+        )
+
+    messages.append(AIMessage(content=response.content))
+    messages.append(HumanMessage(content=(
+        "Results of the planned tool calls:\n\n" + "\n\n".join(observations)
+        + "\n\nAnswer my request using these results. Only call more tools if they are insufficient."
+    )))
+    return await _run_agent_loop(messages, llm, max_iterations, seen)
+
+
+def _parse_plan(content: str) -> List[Dict[str, Any]]:
+    """
+    Extract the list of plan nodes from the planner's JSON response.
+    
+    Args:
+        content (str): Response content of the planning call
+        
+    Returns:
+        List[Dict[str, Any]]: Nodes with id, tool, args and deps keys
+        
+    Raises:
+        ValueError: If the response does not contain a valid plan
+    """
+    start, end = content.find("{"), content.rfind("}")
+    if start == -1 or end < start:
+        raise ValueError("no JSON object in planner response")
+    plan = orjson.loads(content[start:end + 1])
+
+    nodes = plan.get("nodes") if isinstance(plan, dict) else None
+    if not isinstance(nodes, list):
+        raise ValueError("plan has no 'nodes' list")
+    for node in nodes:
+        if not isinstance(node, dict) or "id" not in node or "tool" not in node:
+            raise ValueError(f"malformed plan node: {node}")
+        node["id"] = str(node["id"])
+        if not isinstance(node["tool"], str):
+            raise ValueError(f"plan node {node['id']} has a non-string tool: {node['tool']!r}")
+        node["args"] = node.get("args") or {}
+        if not isinstance(node["args"], dict):
+            raise ValueError(f"plan node {node['id']} has non-object args: {node['args']!r}")
+        deps = node.get("deps") or []
+        if not isinstance(deps, list):
+            raise ValueError(f"plan node {node['id']} has non-list deps: {deps!r}")
+        node["deps"] = [str(dep) for dep in deps]
+    return nodes
+
+
+def _topological_generations(nodes: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """
+    Group plan nodes into generations with Kahn's algorithm.
+    
+    Every node of a generation only depends on nodes of earlier generations,
+    so the nodes within one generation can run concurrently.
+    
+    Args:
+        nodes (List[Dict[str, Any]]): Parsed plan nodes
+        
+    Returns:
+        List[List[Dict[str, Any]]]: The nodes grouped by generation
+        
+    Raises:
+        ValueError: If a dependency is unknown or the plan contains a cycle
+    """
+    by_id = {node["id"]: node for node in nodes}
+    pending = {node["id"]: set(node["deps"]) for node in nodes}
+    for node_id, deps in pending.items():
+        unknown = deps - by_id.keys()
+        if unknown:
+            raise ValueError(f"node {node_id} depends on unknown nodes {sorted(unknown)}")
+
+    generations = []
+    while pending:
+        ready = [node_id for node_id, deps in pending.items() if not deps]
+        if not ready:
+            raise ValueError("plan contains a dependency cycle")
+        generations.append([by_id[node_id] for node_id in ready])
+        for node_id in ready:
+            del pending[node_id]
+        for deps in pending.values():
+            deps.difference_update(ready)
+    return generations
+
+
+def _run_plan_node(node: Dict[str, Any]) -> str:
+    """
+    Execute the tool of a single plan node.
+    
+    Args:
+        node (Dict[str, Any]): Plan node with tool, args and id keys
+        
+    Returns:
+        str: The tool output, or an error message for unknown tools and invalid arguments
+    """
+    try:
+        tool_message = call_tool(
+            {"name": node["tool"], "args": node["args"], "id": node["id"], "type": "tool_call"}
+        )
+    except KeyError:
+        return f"Error: unknown tool '{node['tool']}'"
+    except Exception as e:
+        # Typically a ValidationError for missing or ill-typed arguments
+        return f"Error running {node['tool']}: {str(e)}"
+    return tool_message.content
\ No newline at end of file
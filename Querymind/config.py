@@ -11,7 +11,6 @@ for the Querymind application. Designed for deployment on Streamlit Cloud with A
 # Standard library imports
 import os
 import random
-import numpy as np
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -71,6 +70,14 @@ class Config:
     SEED = 42
     MODEL = LLAMA_3_3
     OLLAMA_CONTEXT_WINDOW = 2048
+    # Plan the tool calls up front and run them as a DAG instead of the ReAct loop
+    USE_COMPILER = os.getenv('USE_COMPILER', 'false').lower() in ('1', 'true', 'yes')
+    # Maximum number of result rows returned to the LLM by execute_sql
+    MAX_TOOL_OUTPUT_ROWS = int(os.getenv('MAX_TOOL_OUTPUT_ROWS', '200'))
+    # Maximum number of LLM requests the web app runs at once across all sessions
+    MAX_CONCURRENT_LLM_CALLS = int(os.getenv('MAX_CONCURRENT_LLM_CALLS', '8'))
+    # bcrypt cost factor for new password hashes; calibrated on the host when unset
+    BCRYPT_ROUNDS = int(os.getenv('BCRYPT_ROUNDS')) if os.getenv('BCRYPT_ROUNDS') else None
 
     # API keys
     GROQ_API_KEY = os.getenv('GROQ_API_KEY')
@@ -119,10 +126,16 @@ class Config:
 
 def seed_everything(seed: int = Config.SEED):
     """
-    Set random seeds for reproducibility across random and NumPy.
+    Set random seeds for reproducibility across random and, if installed, NumPy.
+    
+    NumPy is imported lazily here so that importing the configuration stays cheap.
     
     Args:
         seed (int): Seed value for random number generators
     """
     random.seed(seed)
+    try:
+        import numpy as np
+    except ImportError:
+        return
     np.random.seed(seed)
\ No newline at end of file
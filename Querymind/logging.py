@@ -8,6 +8,9 @@ This module provides enhanced console logging capabilities using Rich library
 to display formatted messages and panels with customizable styles.
 """
 
+# Standard library imports
+import os
+
 # Third-party imports
 from rich.console import Console
 from rich.panel import Panel
@@ -20,6 +23,9 @@ green_border_style = Style(color="#10B981")  # Success style with green border
 # Initialize Rich console
 console = Console()
 
+# Panels are rendered on every tool call; set QM_LOG=off to skip them in production
+PANELS_ENABLED = os.getenv("QM_LOG", "info").lower() != "off"
+
 
 def log(
     content: str,
@@ -42,7 +48,7 @@ def log_panel(
     Log a message within a styled panel with title.
     
     Creates a visually distinct panel around the log message with a title
-    and customizable border style.
+    and customizable border style. Does nothing when QM_LOG is set to "off".
     
     Args:
         title (str): The title of the panel
@@ -50,6 +56,8 @@ def log_panel(
         border_style (Style, optional): The style for the panel border.
                                        Defaults to blue_border_style.
     """
+    if not PANELS_ENABLED:
+        return
     console.log(
         Panel(
             content,
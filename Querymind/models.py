@@ -11,29 +11,45 @@ from various providers (Ollama, Groq) using the LangChain framework.
 # Third-party imports
 import groq
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.runnables import Runnable
 from langchain_groq import ChatGroq
 from langchain_ollama import ChatOllama
 
 # Local application imports
 from Querymind.config import Config, ModelConfig, ModelProvider
+from Querymind.tools import get_available_tools
 
 # Initialize Groq client with API key from configuration
 client = groq.Groq(api_key=Config.GROQ_API_KEY)
 
 
-def create_llm(model_config: ModelConfig) -> BaseChatModel:
+def create_llm(model_config: ModelConfig) -> Runnable:
     """
     Create and configure a language model based on the provided configuration.
     
     Factory function that instantiates the appropriate LangChain chat model
-    based on the specified provider (Ollama or Groq).
+    based on the specified provider (Ollama or Groq) and binds the database
+    tools to it, so the tool schemas are built once per model.
     
     Args:
         model_config (ModelConfig): Configuration for the model including
                                    name, temperature, and provider
     
     Returns:
-        BaseChatModel: Configured language model instance ready for use
+        Runnable: Configured language model with the database tools bound, ready for use
+    """
+    return _create_chat_model(model_config).bind_tools(get_available_tools())
+
+
+def _create_chat_model(model_config: ModelConfig) -> BaseChatModel:
+    """
+    Instantiate the bare LangChain chat model for a model configuration.
+    
+    Args:
+        model_config (ModelConfig): Configuration for the model
+    
+    Returns:
+        BaseChatModel: The chat model without tools bound
     """
     if model_config.provider == ModelProvider.OLLAMA:
         return ChatOllama(
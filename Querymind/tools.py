@@ -10,10 +10,14 @@ allowing the LLM to explore database schema and execute queries in a structured
 
 # Standard library imports
 import sqlite3
-from contextlib import contextmanager
-from typing import Any, List
+import threading
+from contextlib import closing, contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 # Third-party imports
+import orjson
 from langchain.tools import tool
 from langchain_core.messages import ToolMessage
 from langchain_core.messages.tool import ToolCall
@@ -23,6 +27,25 @@ from langchain_core.tools import BaseTool
 from Querymind.config import Config
 from Querymind.logging import log, log_panel
 
+# Open SQLite connections, keyed by (database path, readonly) and reused across tool calls
+_conn_cache: Dict[Tuple[Path, bool], "_SharedConnection"] = {}
+_conn_lock = threading.Lock()
+
+
+class _SharedConnection:
+    """
+    A cached SQLite connection, the file it was opened on and the cursors using it.
+    
+    Several Streamlit sessions share a connection, so it may only be closed once no
+    cursor uses it; retired connections are closed by the last cursor to finish.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, inode: int):
+        self.conn = conn
+        self.inode = inode
+        self.users = 0
+        self.retired = False
+
 
 def get_available_tools() -> List[BaseTool]:
     """
@@ -45,19 +68,166 @@ def call_tool(tool_call: ToolCall) -> Any:
     Returns:
         ToolMessage: Message containing the tool's response to be sent back to the LLM
     """
-    tools_by_name = {tool.name: tool for tool in get_available_tools()}
-    tool = tools_by_name[tool_call["name"]]
+    tool = _TOOLS_BY_NAME[tool_call["name"]]
     response = tool.invoke(tool_call["args"])
     return ToolMessage(content=response, tool_call_id=tool_call["id"])
 
 
+def _open_connection(db_path: Path, readonly: bool) -> sqlite3.Connection:
+    """
+    Open a connection to a database file, configured for the tools.
+    
+    Read-only connections are opened with SQLite's ``mode=ro`` URI flag in autocommit
+    mode, with memory-mapped I/O and a 64 MiB page cache. Writable connections use WAL
+    journaling with synchronous=NORMAL. Connections are shared between threads,
+    so they are created with ``check_same_thread=False``.
+    
+    Args:
+        db_path (Path): Path of the SQLite database file
+        readonly (bool): Whether to open the database in read-only mode
+    
+    Returns:
+        sqlite3.Connection: Open connection to the database
+    """
+    if readonly:
+        # Autocommit mode skips the driver's implicit transactions; the pragmas
+        # enable memory-mapped reads and a larger page cache for SELECT workloads
+        conn = sqlite3.connect(
+            f"{db_path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        pragmas = (
+            "PRAGMA query_only = 1;",
+            "PRAGMA temp_store = MEMORY;",
+            "PRAGMA mmap_size = 1073741824;",
+            "PRAGMA cache_size = -65536;",
+        )
+    else:
+        # WAL with synchronous=NORMAL avoids the two fsyncs per commit of the
+        # default rollback journal and lets readers run alongside the writer
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        pragmas = (
+            "PRAGMA journal_mode = WAL;",
+            "PRAGMA synchronous = NORMAL;",
+            "PRAGMA wal_autocheckpoint = 1000;",
+        )
+    try:
+        # The first pragma fails with "file is not a database" for other files
+        for pragma in pragmas:
+            conn.execute(pragma)
+    except sqlite3.Error:
+        conn.close()
+        raise
+    return conn
+
+
+def validate_database(db_path: Path):
+    """
+    Check that a file is an intact SQLite database with PRAGMA quick_check.
+    
+    Uses a short-lived read-only connection of its own, so files that have not
+    been put in place yet, e.g. uploads, can be checked.
+    
+    Args:
+        db_path (Path): Path of the file to check
+        
+    Raises:
+        sqlite3.DatabaseError: If the file is not a database or is corrupt
+    """
+    with closing(sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)) as conn:
+        result = conn.execute("PRAGMA quick_check;").fetchone()
+    if result[0] != "ok":
+        raise sqlite3.DatabaseError(result[0])
+
+
+def _acquire_connection(db_path: Path, readonly: bool) -> _SharedConnection:
+    """
+    Return the cached connection for a database file and count the caller as a user.
+    
+    A cached connection to a file that has since been replaced at the same path
+    (new inode) is retired and a connection to the new file is opened.
+    Every call must be paired with _release_connection().
+    
+    Args:
+        db_path (Path): Path of the SQLite database file
+        readonly (bool): Whether to open the database in read-only mode
+    
+    Returns:
+        _SharedConnection: The cached connection, with its user count incremented
+        
+    Raises:
+        FileNotFoundError: If the database file is not found
+    """
+    key = (db_path, readonly)
+    inode = db_path.stat().st_ino
+    with _conn_lock:
+        shared = _conn_cache.get(key)
+        if shared is not None and shared.inode != inode:
+            _retire_connection(key)
+            shared = None
+        if shared is None:
+            shared = _SharedConnection(_open_connection(db_path, readonly), inode)
+            _conn_cache[key] = shared
+        shared.users += 1
+        return shared
+
+
+def _release_connection(shared: _SharedConnection):
+    """
+    Count a user of a connection out, closing the connection if it is retired and idle.
+    
+    Args:
+        shared (_SharedConnection): Connection returned by _acquire_connection()
+    """
+    with _conn_lock:
+        shared.users -= 1
+        if shared.retired and shared.users == 0:
+            shared.conn.close()
+
+
+def _retire_connection(key: Tuple[Path, bool]):
+    """
+    Drop a connection from the cache, closing it now if idle or else on its last release.
+    
+    Must be called with _conn_lock held.
+    
+    Args:
+        key (Tuple[Path, bool]): Cache key of the connection
+    """
+    shared = _conn_cache.pop(key, None)
+    if shared is None:
+        return
+    shared.retired = True
+    if shared.users == 0:
+        shared.conn.close()
+
+
+def release_sql_connections(db_path: Path):
+    """
+    Retire the cached connections to one database file.
+    
+    Call after the file has been replaced, e.g. when a new database is uploaded.
+    Connections still in use by other sessions are closed when their cursors finish;
+    connections to other files are not affected.
+    
+    Args:
+        db_path (Path): Path of the replaced database file
+    """
+    with _conn_lock:
+        for readonly in (True, False):
+            _retire_connection((db_path, readonly))
+
+
 @contextmanager
 def with_sql_cursor(readonly=True):
     """
     Context manager for SQLite cursor with support for dynamically uploaded databases.
     
-    Creates a connection to the current database file and provides a cursor,
-    handling connection lifecycle and transaction management.
+    Provides a cursor on the cached connection for the current database file,
+    handling transaction management. The connection stays open between calls
+    and is not closed while the cursor is in use.
     
     Args:
         readonly (bool, optional): Whether the operation is read-only.
@@ -72,10 +242,12 @@ def with_sql_cursor(readonly=True):
     if not Config.Path.DATABASE_PATH or not Config.Path.DATABASE_PATH.exists():
         raise FileNotFoundError(f"Database file not found: {Config.Path.DATABASE_PATH}")
         
-    conn = sqlite3.connect(Config.Path.DATABASE_PATH)
-    cur = conn.cursor()
+    shared = _acquire_connection(Config.Path.DATABASE_PATH, readonly)
+    conn = shared.conn
+    cur = None
 
     try:
+        cur = conn.cursor()
         yield cur
         if not readonly:
             conn.commit()
@@ -84,8 +256,133 @@ def with_sql_cursor(readonly=True):
             conn.rollback()
         raise
     finally:
-        cur.close()
-        conn.close()
+        if cur is not None:
+            cur.close()
+        _release_connection(shared)
+
+
+def _database_cache_key() -> Tuple[str, float]:
+    """
+    Identify the current contents of the database file for the schema caches.
+    
+    Returns:
+        Tuple[str, float]: The database path and its modification time
+        
+    Raises:
+        FileNotFoundError: If the database file is not found
+    """
+    if not Config.Path.DATABASE_PATH or not Config.Path.DATABASE_PATH.exists():
+        raise FileNotFoundError(f"Database file not found: {Config.Path.DATABASE_PATH}")
+    return str(Config.Path.DATABASE_PATH), Config.Path.DATABASE_PATH.stat().st_mtime
+
+
+@lru_cache(maxsize=256)
+def _list_tables_cached(db_path: str, mtime: float) -> Tuple[str, ...]:
+    """
+    Read the user-created table names of a database, cached per (db_path, mtime).
+    
+    Args:
+        db_path (str): Path of the database file (cache key)
+        mtime (float): Modification time of the database file (cache key)
+    
+    Returns:
+        Tuple[str, ...]: Names of all user-created tables
+    """
+    with with_sql_cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';"
+        )
+        return tuple(row[0] for row in cursor)
+
+
+@lru_cache(maxsize=256)
+def _describe_table_cached(db_path: str, mtime: float, table_name: str) -> str:
+    """
+    Read the schema of a table, cached per (db_path, mtime, table_name).
+    
+    Args:
+        db_path (str): Path of the database file (cache key)
+        mtime (float): Modification time of the database file (cache key)
+        table_name (str): Name of the table to describe
+    
+    Returns:
+        str: One PRAGMA table_info row per line
+    """
+    with with_sql_cursor() as cursor:
+        cursor.execute("SELECT * FROM pragma_table_info(?);", (table_name,))
+        return "\n".join(map(str, cursor))
+
+
+def _check_table_name(db_key: Tuple[str, float], table_name: str):
+    """
+    Ensure that a table name refers to an existing user-created table.
+    
+    Args:
+        db_key (Tuple[str, float]): Cache key of the database, see _database_cache_key()
+        table_name (str): Table name supplied by the LLM
+        
+    Raises:
+        ValueError: If the table does not exist in the database
+    """
+    if table_name not in _list_tables_cached(*db_key):
+        raise ValueError(f"Table '{table_name}' does not exist. Use list_tables to see the available tables.")
+
+
+def quote_identifier(name: str) -> str:
+    """
+    Quote an SQL identifier so it can be safely embedded in a statement.
+    
+    Args:
+        name (str): Identifier to quote
+    
+    Returns:
+        str: The identifier wrapped in double quotes, with embedded quotes escaped
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+def clear_schema_cache():
+    """
+    Drop all cached schema lookups, e.g. after a new database has been uploaded.
+    """
+    _list_tables_cached.cache_clear()
+    _describe_table_cached.cache_clear()
+
+
+def _json_default(value: Any) -> str:
+    """
+    Serialize values orjson does not support natively, i.e. BLOB columns.
+    
+    Args:
+        value (Any): Value returned by SQLite
+    
+    Returns:
+        str: Hex representation of the bytes
+        
+    Raises:
+        TypeError: If the value is of another unsupported type
+    """
+    if isinstance(value, bytes):
+        return value.hex()
+    raise TypeError
+
+
+def _count_rows(cursor: sqlite3.Cursor, sql_query: str) -> Optional[int]:
+    """
+    Count the rows a query returns by wrapping it in SELECT COUNT(*).
+    
+    Args:
+        cursor (sqlite3.Cursor): Cursor to run the count on
+        sql_query (str): The query whose rows are counted
+    
+    Returns:
+        Optional[int]: The number of rows, or None if the query cannot be wrapped
+    """
+    try:
+        cursor.execute(f"SELECT COUNT(*) FROM ({sql_query.strip().rstrip(';')});")
+        return cursor.fetchone()[0]
+    except sqlite3.Error:
+        return None
 
 
 @tool(parse_docstring=True)
@@ -105,12 +402,7 @@ def list_tables(reasoning: str) -> str:
     )
     
     try:
-        with with_sql_cursor() as cursor:
-            cursor.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';"
-            )
-
-            tables = [row[0] for row in cursor.fetchall()]
+        tables = list(_list_tables_cached(*_database_cache_key()))
         return str(tables)
     except FileNotFoundError as e:
         log(f"[red]Database file not found: {str(e)}[/red]")
@@ -139,10 +431,10 @@ def sample_table(reasoning: str, table_name: str, row_sample_size: int) -> str:
     )
 
     try:
+        _check_table_name(_database_cache_key(), table_name)
         with with_sql_cursor() as cursor:
-            cursor.execute(f"SELECT * FROM {table_name} LIMIT {row_sample_size};")
-            rows = cursor.fetchall()
-        return "\n".join([str(row) for row in rows])
+            cursor.execute(f"SELECT * FROM {quote_identifier(table_name)} LIMIT ?;", (row_sample_size,))
+            return "\n".join(map(str, cursor))
     except FileNotFoundError as e:
         log(f"[red]Database file not found: {str(e)}[/red]")
         return "Error: No database has been uploaded yet. Please upload a SQLite database file first."
@@ -169,10 +461,9 @@ def describe_table(reasoning: str, table_name: str) -> str:
     )
 
     try:
-        with with_sql_cursor() as cursor:
-            cursor.execute(f"PRAGMA table_info('{table_name}');")
-            rows = cursor.fetchall()
-        return "\n".join([str(row) for row in rows])
+        db_key = _database_cache_key()
+        _check_table_name(db_key, table_name)
+        return _describe_table_cached(*db_key, table_name)
     except FileNotFoundError as e:
         log(f"[red]Database file not found: {str(e)}[/red]")
         return "Error: No database has been uploaded yet. Please upload a SQLite database file first."
@@ -191,7 +482,8 @@ def execute_sql(reasoning: str, sql_query: str) -> str:
         sql_query: Complete, properly formatted SQL query
 
     Returns:
-        String with query results, one row per line as tuples
+        Query results as a JSON object with the column names and the rows as arrays.
+        Long results are truncated, with a final line stating how many rows were left out.
     """
     log_panel(
         title="Execute SQL Tool",
@@ -201,11 +493,30 @@ def execute_sql(reasoning: str, sql_query: str) -> str:
     try:
         with with_sql_cursor() as cursor:
             cursor.execute(sql_query)
-            rows = cursor.fetchall()
-        return "\n".join([str(row) for row in rows])
+            # Cap the rows handed back, since every row is re-sent to the LLM on the next turn
+            max_rows = Config.MAX_TOOL_OUTPUT_ROWS
+            rows = cursor.fetchmany(max_rows + 1)
+            truncated = len(rows) > max_rows
+
+            columns = [column[0] for column in cursor.description] if cursor.description else []
+            output = orjson.dumps(
+                {"columns": columns, "rows": rows[:max_rows]}, default=_json_default
+            ).decode()
+
+            if truncated:
+                total_rows = _count_rows(cursor, sql_query)
+                if total_rows is None:
+                    output += f"\n... (more rows truncated, showing the first {max_rows})"
+                else:
+                    output += f"\n... ({total_rows - max_rows} more rows truncated)"
+        return output
     except FileNotFoundError as e:
         log(f"[red]Database file not found: {str(e)}[/red]")
         return "Error: No database has been uploaded yet. Please upload a SQLite database file first."
     except Exception as e:
         log(f"[red]Error running query: {str(e)}[/red]")
-        return f"Error running query: {str(e)}"
\ No newline at end of file
+        return f"Error running query: {str(e)}"
+
+
+# Tool lookup table for call_tool(), built once at import
+_TOOLS_BY_NAME = {tool.name: tool for tool in get_available_tools()}
\ No newline at end of file
@@ -13,32 +13,42 @@ guest and registered users.
 """
 
 # Standard library imports
-import os
+import html
 import random
 import shutil
-import json
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from contextlib import contextmanager
+from contextlib import closing, contextmanager
 
 # Third-party imports
 import streamlit as st
 from dotenv import load_dotenv
-from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.runnables import Runnable
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+import orjson
 import pymysql
 
 # Local application imports
 from Querymind.config import Config
+from Querymind.logging import log
 from Querymind.models import create_llm
-from Querymind.tools import get_available_tools, with_sql_cursor
-from Querymind.agent import ask, create_history
-from auth import init_users_db, show_login_page, logout, delete_user, with_conversations_db_cursor
+from Querymind.tools import (
+    clear_schema_cache, quote_identifier, release_sql_connections, validate_database, with_sql_cursor
+)
+from Querymind.agent import STREAM_RESET, ask, ask_stream, create_history
+from auth import init_users_db, show_login_page, logout, delete_user, with_conversations_db_cursor, close_quietly
+
+# Paths of bundled assets, resolved relative to this file
+BASE_DIR = Path(__file__).resolve().parent
+FAVICON_PATH = BASE_DIR / "static" / "logo2.png"
+STYLE_CSS_PATH = BASE_DIR / "assets" / "style.css"
 
 # Set page configuration at the very top
-favicon_path = os.path.join(os.path.dirname(__file__), "static", "logo2.png")
-if not os.path.exists(favicon_path):
+favicon_path = str(FAVICON_PATH)
+if not FAVICON_PATH.exists():
     st.warning(f"Favicon file not found at {favicon_path}. Using default Streamlit icon.", icon="⚠️")
     favicon_path = None
 
@@ -65,7 +75,7 @@ load_dotenv()
 Config.Path.DATABASE_PATH = None
 
 # Loading messages for query processing
-LOADING_MESSAGES = [
+LOADING_MESSAGES = (
     "Consulting the ancient tomes of SQL wisdom ... ",
     "Casting query spells on your database ... ",
     "Summoning data from the digital realms ... ",
@@ -86,11 +96,22 @@ LOADING_MESSAGES = [
     "Conjuring insights from your database depths ... ",
     "Weaving a tapestry of joins and filters ... ",
     "Preparing a feast of data for your consideration ... ",
-]
+)
+
+# Sample questions offered before the first message of a chat
+SAMPLE_QUESTIONS = (
+    "List all tables in the database.",
+    "Describe the database schema.",
+    "Summarize the database structure.",
+    "Show relations between tables.",
+    "Show top 5 rows of all table",
+)
 
 def init_conversations_db():
     """
     Initialize the conversations MySQL database and ensure correct schema.
+    The schema is created once per process; failed attempts are retried on the next rerun.
+    Returns True if the database is ready.
     """
     required_vars = [
         Config.MYSQL_HOST,
@@ -101,8 +122,33 @@ def init_conversations_db():
     ]
     if not all(required_vars):
         st.error("Missing MySQL configuration for conversations database.", icon="❌")
-        return
+        return False
 
+    try:
+        return create_conversations_schema()
+    except pymysql.Error as e:
+        st.error(f"Error initializing conversations database: {e}", icon="❌")
+        return False
+
+@st.cache_resource(show_spinner=False)
+def _bootstrap():
+    """
+    Initialize both MySQL databases once per server process.
+    Raises RuntimeError if either is not ready, so that the failure is not cached
+    and initialization is retried on the next rerun.
+    """
+    users_ready = init_users_db()
+    conversations_ready = init_conversations_db()
+    if not (users_ready and conversations_ready):
+        raise RuntimeError("Database initialization failed")
+    return True
+
+@st.cache_resource(show_spinner=False)
+def create_conversations_schema():
+    """
+    Create the conversations database and its tables.
+    Cached so the DDL runs at most once per process; errors are raised and not cached.
+    """
     connection = None
     cursor = None
     try:
@@ -122,21 +168,101 @@ def init_conversations_db():
                 user_id VARCHAR(255),
                 title VARCHAR(255) NOT NULL,
                 created_at TIMESTAMP NOT NULL,
-                conversation_json TEXT NOT NULL
+                conversation_json TEXT NULL
+            )
+        """)
+        # conversation_json is only read for sessions saved before the messages
+        # table existed; older schemas declared it NOT NULL, so relax it once.
+        cursor.execute(
+            "SELECT IS_NULLABLE FROM information_schema.COLUMNS "
+            "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'sessions' AND COLUMN_NAME = 'conversation_json'",
+            (Config.MYSQL_CONVERSATIONS_DB,)
+        )
+        row = cursor.fetchone()
+        if row and row[0] == "NO":
+            cursor.execute("ALTER TABLE sessions MODIFY conversation_json TEXT NULL")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS messages (
+                session_id INTEGER NOT NULL,
+                seq INTEGER NOT NULL,
+                type VARCHAR(32) NOT NULL,
+                content MEDIUMTEXT NOT NULL,
+                PRIMARY KEY (session_id, seq),
+                FOREIGN KEY (session_id) REFERENCES sessions(session_id) ON DELETE CASCADE
             )
         """)
         connection.commit()
-    except pymysql.Error as e:
-        st.error(f"Error initializing conversations database: {e}", icon="❌")
+        return True
     finally:
-        if cursor is not None:
-            cursor.close()
-        if connection is not None:
-            connection.close()
+        close_quietly(cursor)
+        close_quietly(connection)
+
+@st.cache_resource(show_spinner=False)
+def get_save_executor():
+    """Create the worker threads that write chat messages in the background."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="save_session")
+
+@st.cache_resource(show_spinner=False)
+def get_llm_semaphore():
+    """Create the semaphore bounding concurrent LLM requests across all sessions."""
+    return threading.BoundedSemaphore(Config.MAX_CONCURRENT_LLM_CALLS)
+
+def write_session_messages(session_id, delete_from, rows):
+    """
+    Write a session's new messages from a background thread.
+
+    Runs without a Streamlit script context, so failures are logged to the console.
+    Returns True if the messages were saved.
+    """
+    try:
+        with with_conversations_db_cursor() as cursor:
+            if delete_from is not None:
+                cursor.execute(
+                    "DELETE FROM messages WHERE session_id = %s AND seq >= %s",
+                    (session_id, delete_from)
+                )
+            if rows:
+                cursor.executemany(
+                    "INSERT INTO messages (session_id, seq, type, content) VALUES (%s, %s, %s, %s) "
+                    "ON DUPLICATE KEY UPDATE type = VALUES(type), content = VALUES(content)",
+                    rows
+                )
+        return True
+    except pymysql.Error as e:
+        log(f"[red]Database error while saving session {session_id}: {e}[/red]")
+        return False
+
+def wait_for_pending_save():
+    """
+    Wait for the background save started by save_session(background=True), if any.
+
+    If it failed, next_seq is rolled back so the next save writes the messages again.
+    """
+    pending = st.session_state.pop("pending_save", None)
+    if pending is not None:
+        future, previous_next_seq = pending
+        if not future.result():
+            st.session_state.next_seq = previous_next_seq
+
+def message_rows(session_id, messages, offset, first_seq):
+    """
+    Serialize the messages from seq first_seq on into messages table rows.
+    offset is the index of seq 0 in messages, i.e. 1 if it starts with the system prompt.
+    """
+    return [
+        (session_id, seq, msg.__class__.__name__, msg.content)
+        for seq, msg in enumerate(messages[offset + first_seq:], start=first_seq)
+    ]
 
-def save_session(session_id, title, messages):
+def save_session(session_id, title, messages, background=False):
     """
     Save or update a chat session in the conversations database for authenticated users.
+
+    Only messages appended since the last save are written to the messages table;
+    st.session_state.next_seq tracks how many of the current session's messages are
+    already stored. If the history got shorter (e.g. Clear Chat), the stale tail is deleted.
+    With background=True, an existing session's messages are written by a worker thread
+    so the caller doesn't wait on MySQL; the next save or load waits for it first.
     """
     if st.session_state.is_guest:
         return None
@@ -144,60 +270,105 @@ def save_session(session_id, title, messages):
     if user_id is None:
         st.error("Cannot save session: Invalid user ID.", icon="❌")
         return None
-    serialized_messages = [
-        {"type": msg.__class__.__name__, "content": msg.content}
-        for msg in messages
-        if not isinstance(msg, SystemMessage)
-    ]
+    wait_for_pending_save()
+    # create_history() puts the only SystemMessage first and it isn't stored, so
+    # message_count messages follow it and only those past next_seq are serialized
+    offset = 1 if messages and isinstance(messages[0], SystemMessage) else 0
+    message_count = len(messages) - offset
+    if background and session_id is not None:
+        next_seq = st.session_state.get("next_seq", 0)
+        delete_from = message_count if message_count < next_seq else None
+        rows = message_rows(session_id, messages, offset, min(next_seq, message_count))
+        future = get_save_executor().submit(write_session_messages, session_id, delete_from, rows)
+        st.session_state.pending_save = (future, min(next_seq, message_count))
+        st.session_state.next_seq = message_count
+        return session_id
     try:
+        created = session_id is None
         with with_conversations_db_cursor() as cursor:
-            if session_id is None:
+            if created:
                 current_time = datetime.now().strftime("%d-%m-%y [%H:%M]")
                 title = f"Chat@{current_time}"
                 cursor.execute(
-                    "INSERT INTO sessions (user_id, title, created_at, conversation_json) VALUES (%s, %s, %s, %s)",
-                    (user_id, title, datetime.now(), json.dumps(serialized_messages))
+                    "INSERT INTO sessions (user_id, title, created_at) VALUES (%s, %s, %s)",
+                    (user_id, title, datetime.now())
                 )
-                cursor.connection.commit()
-                cursor.execute("SELECT LAST_INSERT_ID()")
-                return cursor.fetchone()[0]
+                session_id = cursor.lastrowid
+                next_seq = 0
             else:
-                cursor.execute(
-                    "UPDATE sessions SET title = %s, conversation_json = %s WHERE session_id = %s AND user_id = %s",
-                    (title, json.dumps(serialized_messages), session_id, user_id)
+                next_seq = st.session_state.get("next_seq", 0)
+                if message_count < next_seq:
+                    cursor.execute(
+                        "DELETE FROM messages WHERE session_id = %s AND seq >= %s",
+                        (session_id, message_count)
+                    )
+                    next_seq = message_count
+            if message_count > next_seq:
+                # Upsert so a save retried with a stale next_seq overwrites instead of failing;
+                # executemany sends all rows as one multi-row INSERT
+                cursor.executemany(
+                    "INSERT INTO messages (session_id, seq, type, content) VALUES (%s, %s, %s, %s) "
+                    "ON DUPLICATE KEY UPDATE type = VALUES(type), content = VALUES(content)",
+                    message_rows(session_id, messages, offset, next_seq)
                 )
-                cursor.connection.commit()
-                return session_id
+            cursor.connection.commit()
+        if created:
+            _list_sessions_cached.clear()
+        st.session_state.next_seq = message_count
+        return session_id
     except pymysql.Error as e:
         st.error(f"Database error while saving session: {e}", icon="❌")
         return None
 
+# Message classes restored from the stored type names
+MESSAGE_TYPES = {"HumanMessage": HumanMessage, "AIMessage": AIMessage}
+
 def load_session(session_id):
     """
     Load a chat session from the conversations database.
+
+    Sessions saved before the messages table existed are read from their
+    legacy conversation_json column and moved into the messages table.
     """
     if st.session_state.is_guest:
         return create_history()
     user_id = st.session_state.user.get("user_id")
     if user_id is None:
         return create_history()
+    wait_for_pending_save()
+    history = create_history()
     try:
         with with_conversations_db_cursor() as cursor:
             cursor.execute(
-                "SELECT conversation_json FROM sessions WHERE session_id = %s AND user_id = %s",
+                "SELECT m.type, m.content FROM messages m JOIN sessions s ON s.session_id = m.session_id "
+                "WHERE m.session_id = %s AND s.user_id = %s ORDER BY m.seq",
                 (session_id, user_id)
             )
-            result = cursor.fetchone()
-            if result:
-                messages = json.loads(result[0])
-                history = create_history()
-                for msg in messages:
-                    if msg["type"] == "HumanMessage":
-                        history.append(HumanMessage(content=msg["content"]))
-                    elif msg["type"] == "AIMessage":
-                        history.append(AIMessage(content=msg["content"]))
-                return history
-            return create_history()
+            rows = cursor.fetchall()
+            if not rows:
+                cursor.execute(
+                    "SELECT conversation_json FROM sessions WHERE session_id = %s AND user_id = %s",
+                    (session_id, user_id)
+                )
+                result = cursor.fetchone()
+                if result and result[0]:
+                    rows = [(msg["type"], msg["content"]) for msg in orjson.loads(result[0])]
+                    cursor.executemany(
+                        "INSERT INTO messages (session_id, seq, type, content) VALUES (%s, %s, %s, %s)",
+                        [(session_id, seq, msg_type, content) for seq, (msg_type, content) in enumerate(rows)]
+                    )
+                    cursor.execute(
+                        "UPDATE sessions SET conversation_json = NULL WHERE session_id = %s",
+                        (session_id,)
+                    )
+                    cursor.connection.commit()
+        history.extend(
+            MESSAGE_TYPES[msg_type](content=content)
+            for msg_type, content in rows
+            if msg_type in MESSAGE_TYPES
+        )
+        st.session_state.next_seq = len(rows)
+        return history
     except pymysql.Error as e:
         st.error(f"Database error while loading session: {e}", icon="❌")
         return create_history()
@@ -213,11 +384,13 @@ def delete_session(session_id):
         return
     try:
         with with_conversations_db_cursor() as cursor:
+            # The session's messages go with it via ON DELETE CASCADE
             cursor.execute(
                 "DELETE FROM sessions WHERE session_id = %s AND user_id = %s",
                 (session_id, user_id)
             )
             cursor.connection.commit()
+        _list_sessions_cached.clear()
         if "current_session_id" in st.session_state and st.session_state.current_session_id == session_id:
             new_session_id = save_session(None, "", create_history())
             st.session_state.current_session_id = new_session_id
@@ -226,66 +399,218 @@ def delete_session(session_id):
     except pymysql.Error as e:
         st.error(f"Database error while deleting session: {e}", icon="❌")
 
-def list_sessions():
+# Number of chat sessions shown per "Load more" page of the sidebar
+SESSIONS_PAGE_SIZE = 25
+
+def list_sessions(page=0, page_size=SESSIONS_PAGE_SIZE):
     """
-    List all chat sessions for the current user.
+    List one page of chat sessions for the current user, newest first.
+
+    Returns:
+        tuple: (sessions, has_more) where sessions is a list of
+               (session_id, title, created_at) tuples
     """
     if st.session_state.is_guest:
-        return []
+        return [], False
     user_id = st.session_state.user.get("user_id")
     if user_id is None:
-        return []
+        return [], False
     try:
-        with with_conversations_db_cursor() as cursor:
-            cursor.execute(
-                "SELECT session_id, title, created_at FROM sessions WHERE user_id = %s ORDER BY created_at DESC",
-                (user_id,)
-            )
-            sessions = [
-                (session_id, title, datetime.strptime(str(created_at), "%Y-%m-%d %H:%M:%S").strftime("%d-%m-%y [%H:%M]"))
-                for session_id, title, created_at in cursor.fetchall()
-            ]
-            return sessions
+        sessions = _list_sessions_cached(user_id, page, page_size)
     except pymysql.Error as e:
         st.error(f"Database error while listing sessions: {e}", icon="❌")
-        return []
+        return [], False
+    return sessions[:page_size], len(sessions) > page_size
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _list_sessions_cached(user_id, page, page_size):
+    """
+    Fetch a page of (session_id, title, created_at) rows for a user, newest first.
 
-def reset_model_cache():
-    """Reset the cached LLM model in session state."""
-    if 'model' in st.session_state:
-        del st.session_state['model']
+    One extra row is fetched to tell whether another page exists. Cached so reruns
+    don't hit MySQL; save_session and delete_session clear the cache whenever a
+    session is created or deleted.
+    """
+    with with_conversations_db_cursor() as cursor:
+        cursor.execute(
+            "SELECT session_id, title, DATE_FORMAT(created_at, '%%d-%%m-%%y [%%H:%%i]') "
+            "FROM sessions WHERE user_id = %s ORDER BY created_at DESC LIMIT %s OFFSET %s",
+            (user_id, page_size + 1, page * page_size)
+        )
+        return [tuple(row) for row in cursor.fetchall()]
 
 @st.cache_resource(show_spinner=False)
-def get_model() -> BaseChatModel:
-    """Create and cache an LLM instance with database tools bound."""
-    llm = create_llm(Config.MODEL)
-    llm = llm.bind_tools(get_available_tools())
-    return llm
+def get_model() -> Runnable:
+    """
+    Create and cache an LLM instance with database tools bound.
+    The tools resolve Config.Path.DATABASE_PATH on every call, so the model
+    does not need to be rebuilt when a new database is uploaded.
+    """
+    return create_llm(Config.MODEL)
+
+def stream_answer(placeholder, chunks):
+    """
+    Render a streamed answer into a placeholder as it arrives and return its text.
+
+    On STREAM_RESET the text shown so far was commentary of a tool-calling turn,
+    so it is replaced by the loading status again until the answer starts.
+    """
+    text = ""
+    for chunk in chunks:
+        if chunk is STREAM_RESET:
+            text = ""
+            placeholder.status(random.choice(LOADING_MESSAGES), state="running")
+            continue
+        text += chunk
+        placeholder.markdown(text + "▌")
+    placeholder.markdown(text)
+    return text
+
+@st.cache_data(show_spinner=False)
+def read_css(css_file):
+    """Read a CSS file, cached so reruns don't go back to disk."""
+    return Path(css_file).read_text(encoding="utf-8")
 
 def load_css(css_file):
     """Load and apply CSS styling from an external file."""
     try:
-        with open(css_file) as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+        st.markdown(f"<style>{read_css(str(css_file))}</style>", unsafe_allow_html=True)
     except FileNotFoundError:
         st.warning("CSS file not found. Default styling will be applied.", icon="⚠️")
 
 def save_uploaded_file(uploaded_file):
-    """Save an uploaded database file to the configured directory."""
+    """
+    Save an uploaded database file to the configured directory.
+
+    The file uploader keeps returning the same upload on every rerun, so an upload
+    that is already saved is only reconnected, not written or checked again. New files
+    are written next to the target, validated with PRAGMA quick_check and then renamed
+    over it, so other sessions still querying the previous file are not disturbed; they
+    are analyzed in a background thread so the sidebar can show row estimates without
+    counting every table.
+    """
     file_path = Config.Path.UPLOADED_DB_DIR / uploaded_file.name
-    with open(file_path, "wb") as f:
-        f.write(uploaded_file.getbuffer())
+    if st.session_state.get("uploaded_file_id") == uploaded_file.file_id and file_path.exists():
+        Config.Path.DATABASE_PATH = file_path
+        return file_path
+    wait_for_analyze()
+    # Stream in 1 MiB chunks rather than materializing the whole upload
+    temp_path = file_path.with_name(f".{uploaded_file.file_id}.{file_path.name}")
+    uploaded_file.seek(0)
+    with open(temp_path, "wb") as f:
+        shutil.copyfileobj(uploaded_file, f, length=1024 * 1024)
     try:
-        with sqlite3.connect(file_path) as conn:
-            conn.cursor().execute("SELECT 1")
+        validate_database(temp_path)
     except sqlite3.Error:
         st.error("Invalid SQLite database file.", icon="❌")
-        file_path.unlink()
+        temp_path.unlink()
+        return None
+    try:
+        temp_path.replace(file_path)
+    except OSError:
+        # Windows refuses to replace a file that another session still has open
+        temp_path.unlink()
+        st.error("A database with this name is in use by another session. Please try again shortly.", icon="❌")
         return None
+    release_sql_connections(file_path)
+    st.session_state.uploaded_file_id = uploaded_file.file_id
     Config.Path.DATABASE_PATH = file_path
-    reset_model_cache()
+    clear_schema_cache()
+    thread = threading.Thread(target=analyze_database, args=(file_path,), daemon=True)
+    thread.start()
+    st.session_state.analyze_thread = thread
     return file_path
 
+@st.cache_data(show_spinner=False)
+def header_html(welcome_text):
+    """Build the page header markup for a welcome text, cached across reruns."""
+    return f"""
+<div style="text-align: center;">
+    <h1 style="color: #39ffa2; text-shadow: 0 0 8px #39ffa2, 0 0 16px #39ffa2; font-size: 6rem; margin-bottom: 0.2rem;">
+        QueryMind
+    </h1>
+    <p style="font-family: 'Orbitron', sans-serif; color: #ff69b4; font-size: 1.8rem; font-weight: 600; text-shadow: 0 0 6px #ff69b4, 0 0 12px #ffb6c1; margin: 0 0 0 -1.6rem;">
+        Database Query Assistant
+    </p>
+    <p style="font-size: 1.1rem; color: #d2f5d0; max-width: 600px; margin: 0 auto 0.5rem auto; text-shadow: 0 0 6px #39ffa2; font-style: italic;">
+        Intelligence that speaks your language to extract insights — Talk to your database using natural language.
+    </p>
+    <p style="font-family: 'Orbitron', sans-serif; font-size: 1rem; color: yellow; margin: 0.5rem auto 3rem auto; text-shadow: 0 0 9px #39ffa2;">
+        Welcome, {welcome_text}
+    </p>
+</div>
+"""
+
+def nav_button(label, key):
+    """Render a sidebar navigation button, highlighted as primary when its tab is active."""
+    # on_click switches the tab before the rerun, so the highlight follows the click
+    st.button(
+        label,
+        key=key,
+        type="primary" if st.session_state.sidebar_nav == label else "secondary",
+        on_click=st.session_state.update,
+        kwargs={"sidebar_nav": label},
+    )
+
+# SQLite rejects compound SELECTs with more than 500 terms by default
+MAX_COMPOUND_SELECT = 500
+
+def count_table_rows(cursor, tables):
+    """
+    Count the rows of every table, preferring ANALYZE statistics over full scans.
+
+    Tables with an entry in sqlite_stat1 get its row estimate; the others are
+    counted exactly with one UNION ALL query per 500 tables.
+
+    Returns:
+        list: (table_name, row_count, is_estimate) tuples, in the order of tables
+    """
+    estimates = {}
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+    if cursor.fetchone():
+        # The first number of each stat is the row count of the table or index
+        cursor.execute("SELECT tbl, stat FROM sqlite_stat1")
+        for table, stat in cursor.fetchall():
+            try:
+                estimates[table] = max(estimates.get(table, 0), int(stat.split()[0]))
+            except (AttributeError, IndexError, ValueError):
+                continue
+
+    exact = {}
+    missing = [table for table in tables if table not in estimates]
+    for start in range(0, len(missing), MAX_COMPOUND_SELECT):
+        chunk = missing[start:start + MAX_COMPOUND_SELECT]
+        cursor.execute(
+            " UNION ALL ".join(f"SELECT ?, COUNT(*) FROM {quote_identifier(table)}" for table in chunk),
+            chunk
+        )
+        exact.update(cursor.fetchall())
+    return [
+        (table, exact[table], False) if table in exact else (table, estimates[table], True)
+        for table in tables
+    ]
+
+def analyze_database(db_path):
+    """
+    Run a bounded ANALYZE on a database file so count_table_rows can use sqlite_stat1.
+
+    Meant to run in a background thread after an upload; it opens its own connection
+    and logs failures to the console.
+    """
+    try:
+        with closing(sqlite3.connect(db_path, timeout=30, isolation_level=None)) as conn:
+            # Sample at most ~1000 rows per index instead of scanning whole tables
+            conn.execute("PRAGMA analysis_limit = 1000")
+            conn.execute("ANALYZE")
+    except sqlite3.Error as e:
+        log(f"[red]Error analyzing {db_path}: {e}[/red]")
+
+def wait_for_analyze():
+    """Wait for the background ANALYZE of the previous upload, if still running."""
+    thread = st.session_state.pop("analyze_thread", None)
+    if thread is not None:
+        thread.join()
+
 def clear_chat():
     """Clear the current session's chat history."""
     if st.session_state.is_guest:
@@ -302,8 +627,10 @@ def clear_chat():
     return False
 
 # Initialize databases
-init_users_db()
-init_conversations_db()
+try:
+    _bootstrap()
+except RuntimeError:
+    pass  # The failing init function has already shown its error
 
 # Validate user dictionary for registered users
 if not st.session_state.is_guest and (st.session_state.user is None or 'name' not in st.session_state.user or 'user_id' not in st.session_state.user):
@@ -349,45 +676,17 @@ if "pending_sample_question" not in st.session_state:
     st.session_state.pending_sample_question = None
 
 # Load custom CSS
-load_css("assets/style.css")
+load_css(STYLE_CSS_PATH)
 
 # Application Header
 welcome_text = "Guest User" if st.session_state.is_guest else f"{st.session_state.user.get('name', 'Unknown User')} (user_id: {st.session_state.user.get('user_id', 'N/A')})"
-st.markdown(f"""
-<div style="text-align: center;">
-    <h1 style="color: #39ffa2; text-shadow: 0 0 8px #39ffa2, 0 0 16px #39ffa2; font-size: 6rem; margin-bottom: 0.2rem;">
-        QueryMind
-    </h1>
-    <p style="font-family: 'Orbitron', sans-serif; color: #ff69b4; font-size: 1.8rem; font-weight: 600; text-shadow: 0 0 6px #ff69b4, 0 0 12px #ffb6c1; margin: 0 0 0 -1.6rem;">
-        Database Query Assistant
-    </p>
-    <p style="font-size: 1.1rem; color: #d2f5d0; max-width: 600px; margin: 0 auto 0.5rem auto; text-shadow: 0 0 6px #39ffa2; font-style: italic;">
-        Intelligence that speaks your language to extract insights — Talk to your database using natural language.
-    </p>
-    <p style="font-family: 'Orbitron', sans-serif; font-size: 1rem; color: yellow; margin: 0.5rem auto 3rem auto; text-shadow: 0 0 9px #39ffa2;">
-        Welcome, {welcome_text}
-    </p>
-</div>
-""", unsafe_allow_html=True)
+st.markdown(header_html(welcome_text), unsafe_allow_html=True)
 
 # File Uploader
 st.markdown('<div style="padding: 1rem 0;">', unsafe_allow_html=True)
 uploaded_file = st.file_uploader("Upload SQLite Database", type=["sqlite", "db", "sqlite3"], label_visibility="collapsed")
 st.markdown('</div>', unsafe_allow_html=True)
 
-# Custom font styling for alerts
-st.markdown("""
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=Orbitron:wght@400;500;700&display=swap');
-        div[data-testid="stAlert"] p {
-            font-family: 'Orbitron', sans-serif !important;
-            font-weight: 500;
-            font-size: 1rem;
-            color: rgba(255, 255, 255, 0.5) !important;
-        }
-    </style>
-""", unsafe_allow_html=True)
-
 # === Database Upload Handling ===
 if uploaded_file is not None:
     db_path = save_uploaded_file(uploaded_file)
@@ -402,34 +701,20 @@ else:
 with st.sidebar:
     st.markdown('<div class="nav-buttons">', unsafe_allow_html=True)
     
+    if "sidebar_nav" not in st.session_state:
+        st.session_state.sidebar_nav = "Database Info"
+
     col1, col2, col3 = st.columns([0.95, 0.7, 0.89])
     with col1:
-        if st.button("Database Info", key="nav_db_info"):
-            st.session_state.sidebar_nav = "Database Info"
+        nav_button("Database Info", "nav_db_info")
     with col3:
-        if st.button("Chat History", key="nav_chat_history"):
-            st.session_state.sidebar_nav = "Chat History"
+        nav_button("Chat History", "nav_chat_history")
     
     with col2:
-        if st.button("Settings", key="nav_settings"):
-            st.session_state.sidebar_nav = "Settings"
+        nav_button("Settings", "nav_settings")
     
     st.markdown('</div>', unsafe_allow_html=True)
 
-    if "sidebar_nav" not in st.session_state:
-        st.session_state.sidebar_nav = "Database Info"
-    st.markdown(f"""
-        <style>
-            button[data-testid="baseButton-primary"]:has(span:contains("{st.session_state.sidebar_nav}")) {{
-                background-color: #39ffa2 !important;
-                color: #1e1e1e !important;
-                border: none !important;
-                box-shadow: 0 0 10px #39ffa2 !important;
-                font-family: 'Orbitron', sans-serif !important;
-            }}
-        </style>
-    """, unsafe_allow_html=True)
-
     if st.session_state.sidebar_nav == "Database Info":
         st.markdown("""
             <div class="card sidebar-header">
@@ -468,15 +753,12 @@ with st.sidebar:
                         """, unsafe_allow_html=True)
                         
                         with st.expander("View Tables", expanded=True):
-                            for table in tables:
-                                cursor.execute(f"SELECT count(*) FROM {table};")
-                                count = cursor.fetchone()[0]
-                                st.markdown(f"""
-                                    <div class="table-item">
-                                        <span>{table}</span>
-                                        <span class="row-count">{count} rows</span>
-                                    </div>
-                                """, unsafe_allow_html=True)
+                            # One markdown element for all rows instead of one per table
+                            st.markdown("".join(
+                                f'<div class="table-item"><span>{html.escape(table)}</span>'
+                                f'<span class="row-count">{"~" if is_estimate else ""}{count} rows</span></div>'
+                                for table, count, is_estimate in count_table_rows(cursor, tables)
+                            ), unsafe_allow_html=True)
                     else:
                         st.warning("No tables found in the database.", icon="⚠️")
             except Exception as e:
@@ -520,29 +802,36 @@ with st.sidebar:
                 st.rerun()
             st.markdown('</div>', unsafe_allow_html=True)
 
-        sessions = list_sessions()
+        sessions = []
+        for page in range(st.session_state.get("sessions_page", 0) + 1):
+            page_sessions, has_more = list_sessions(page)
+            sessions.extend(page_sessions)
         if sessions:
             st.markdown("<h3 class='glow-header db-details'>Previous Chats</h3>", unsafe_allow_html=True)
 
-            for session_id, title, created_at in sessions:
-                col1, col2 = st.columns([4, 1])
-                with col1:
-                    button_type = "primary" if session_id == st.session_state.current_session_id else "secondary"
-                    if st.button(
-                        f"{title}",
-                        key=f"session_{session_id}",
-                        help=title,
-                        type=button_type
-                    ):
-                        st.session_state.current_session_id = session_id
-                        st.session_state.session_title = title
-                        st.session_state.messages = load_session(session_id)
-                        st.session_state.has_interacted = False
-                        st.rerun()
-                with col2:
-                    if st.button("🗑️", key=f"delete_{session_id}"):
-                        delete_session(session_id)
-                        st.rerun()
+            # One radio for all sessions instead of a select and a delete button per row
+            titles = {session_id: title for session_id, title, created_at in sessions}
+            session_ids = list(titles)
+            current_session_id = st.session_state.current_session_id
+            selected_session_id = st.radio(
+                "Previous Chats",
+                options=session_ids,
+                index=session_ids.index(current_session_id) if current_session_id in titles else None,
+                format_func=titles.get,
+                label_visibility="collapsed",
+            )
+            if selected_session_id is not None and selected_session_id != current_session_id:
+                st.session_state.current_session_id = selected_session_id
+                st.session_state.session_title = titles[selected_session_id]
+                st.session_state.messages = load_session(selected_session_id)
+                st.session_state.has_interacted = False
+                st.rerun()
+            if selected_session_id is not None and st.button("🗑️ Delete selected", key="delete_selected_session"):
+                delete_session(selected_session_id)
+                st.rerun()
+            if has_more and st.button("Load more", key="load_more_sessions", type="tertiary"):
+                st.session_state.sessions_page = st.session_state.get("sessions_page", 0) + 1
+                st.rerun()
         else:
             st.info("ℹ️ Login to access chat sessions")
     elif st.session_state.sidebar_nav == "Settings":
@@ -584,18 +873,9 @@ st.markdown("<hr style='border: 1px solid rgba(57, 255, 162, 0.3); margin: 15px
 sample_container = st.container()
 if Config.Path.DATABASE_PATH and Config.Path.DATABASE_PATH.exists() and not st.session_state.has_interacted:
     with sample_container:
-        sample_questions = [
-            "List all tables in the database.",
-            "Describe the database schema.",
-            "Summarize the database structure.",
-            "Show relations between tables.",
-            "Show top 5 rows of all table"
-        ]
-
         st.markdown('<div class="new-chat-container">', unsafe_allow_html=True)
-        cols = st.columns(len(sample_questions))
-        for idx, question in enumerate(sample_questions):
-            with cols[idx]:
+        for idx, (col, question) in enumerate(zip(st.columns(len(SAMPLE_QUESTIONS)), SAMPLE_QUESTIONS)):
+            with col:
                 if st.button(question, key=f"sample_{idx}", help=question, type="secondary"):
                     st.session_state.has_interacted = True
                     st.session_state.pending_sample_question = question
@@ -605,29 +885,40 @@ if Config.Path.DATABASE_PATH and Config.Path.DATABASE_PATH.exists() and not st.s
 if st.session_state.pending_sample_question:
     question = st.session_state.pending_sample_question
     st.session_state.messages.append(HumanMessage(content=question))
-    if not st.session_state.is_guest:
-        save_session(
-            st.session_state.current_session_id,
-            st.session_state.session_title,
-            st.session_state.messages
-        )
+    # The question is saved together with the answer; on its own only if no answer comes
     if not Config.Path.DATABASE_PATH or not Config.Path.DATABASE_PATH.exists():
         st.session_state.pending_sample_question = None
+        if not st.session_state.is_guest:
+            save_session(
+                st.session_state.current_session_id,
+                st.session_state.session_title,
+                st.session_state.messages
+            )
         st.error("Please upload a valid SQLite database file first.", icon="❌")
     else:
         try:
-            response = ask(question, st.session_state.messages, get_model())
+            # ask() appends the query itself; pass the history without it so the
+            # model sees a single copy and the prompt prefix matches the saved chat
+            with get_llm_semaphore():
+                response = ask(question, st.session_state.messages[:-1], get_model())
             st.session_state.messages.append(AIMessage(content=response))
             if not st.session_state.is_guest:
                 save_session(
                     st.session_state.current_session_id,
                     st.session_state.session_title,
-                    st.session_state.messages
+                    st.session_state.messages,
+                    background=True
                 )
             st.session_state.pending_sample_question = None
             st.rerun()
         except Exception as e:
             st.session_state.pending_sample_question = None
+            if not st.session_state.is_guest:
+                save_session(
+                    st.session_state.current_session_id,
+                    st.session_state.session_title,
+                    st.session_state.messages
+                )
             error_msg = str(e).lower()
             if any(keyword in error_msg for keyword in ["limit exceeded", "rate limit", "quota exceeded"]):
                 st.error(f"Usage limit exceeded. Please try again later or upgrade your plan. Error details: {str(e)}", icon="⚠️")
@@ -650,13 +941,8 @@ if st.session_state.pending_sample_question:
 
 if prompt := st.chat_input("Type your message ... "):
     st.session_state.has_interacted = True
+    # The prompt is saved together with the answer; on its own only if no answer comes
     st.session_state.messages.append(HumanMessage(content=prompt))
-    if not st.session_state.is_guest:
-        save_session(
-            st.session_state.current_session_id,
-            st.session_state.session_title,
-            st.session_state.messages
-        )
 
     with st.chat_message("ai", avatar="🤖"):
         message_placeholder = st.empty()
@@ -664,21 +950,38 @@ if prompt := st.chat_input("Type your message ... "):
 
         if not Config.Path.DATABASE_PATH or not Config.Path.DATABASE_PATH.exists():
             message_placeholder.empty()
+            if not st.session_state.is_guest:
+                save_session(
+                    st.session_state.current_session_id,
+                    st.session_state.session_title,
+                    st.session_state.messages
+                )
             st.error("Please upload a valid SQLite database file first.", icon="❌")
         else:
             try:
-                response = ask(prompt, st.session_state.messages, get_model())
-                message_placeholder.markdown(response)
+                # The loading status stays up until the first token replaces it
+                with get_llm_semaphore():
+                    response = stream_answer(
+                        message_placeholder,
+                        ask_stream(prompt, st.session_state.messages[:-1], get_model())
+                    )
                 st.session_state.messages.append(AIMessage(content=response))
                 if not st.session_state.is_guest:
                     save_session(
                         st.session_state.current_session_id,
                         st.session_state.session_title,
-                        st.session_state.messages
+                        st.session_state.messages,
+                        background=True
                     )
                 st.rerun()
             except Exception as e:
                 message_placeholder.empty()
+                if not st.session_state.is_guest:
+                    save_session(
+                        st.session_state.current_session_id,
+                        st.session_state.session_title,
+                        st.session_state.messages
+                    )
                 error_msg = str(e).lower()
                 if any(keyword in error_msg for keyword in ["limit exceeded", "rate limit", "quota exceeded"]):
                     st.error(f"Usage limit exceeded. Please try again later or upgrade your plan. Error details: {str(e)}", icon="⚠️")
@@ -8,28 +8,119 @@ This module provides user authentication functionality for the Querymind applica
 including login, registration, guest access, and logout. It uses MySQL for user storage
 and bcrypt for secure password hashing. The login interface is styled with a neon-themed
 UI, featuring squarish input fields, centered navigation buttons, descriptive text, and
-a full-page background image. User IDs are formatted as QM1, QM2, etc., and reused after deletion.
+a full-page background image. User IDs are AUTO_INCREMENT numbers, shown and passed around as QM1, QM2, etc.
 """
 
 # Standard library imports
 from pathlib import Path
-import base64
 import re
 import os
-from contextlib import contextmanager  # Added missing import
+import math
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
 
 # Third-party imports
 import streamlit as st
 import bcrypt
 import pymysql
+from cachetools import TTLCache
 
 # Local application imports
 from Querymind.config import Config
 
+# Password policy character classes
+_RE_UPPER = re.compile(r"[A-Z]")
+_RE_LOWER = re.compile(r"[a-z]")
+_RE_DIGIT = re.compile(r"[0-9]")
+_RE_SPECIAL = re.compile(r"[@#$%^&+=]")
+# All of the above plus a minimum length of 8, checked in a single match
+_RE_PASSWORD = re.compile(r"(?=.*[A-Z])(?=.*[a-z])(?=.*[0-9])(?=.*[@#$%^&+=]).{8,}", re.DOTALL)
+
+def close_quietly(resource):
+    """
+    Close a PyMySQL cursor or connection if there is one.
+    PyMySQL raises when closing a connection that was already closed, e.g. after
+    the server dropped it; ignoring that keeps cleanup from masking the original error.
+    """
+    if resource is None:
+        return
+    try:
+        resource.close()
+    except pymysql.Error:
+        pass
+
+class ConnectionPool:
+    """
+    Thread-safe pool of PyMySQL connections to a single database.
+
+    Reusing connections saves the TCP, TLS and authentication handshake that
+    Streamlit reruns would otherwise pay on every query. Connections idle for
+    longer than max_idle seconds are dropped on checkout, as the server may
+    have closed them in the meantime.
+    """
+
+    def __init__(self, database, size=5, max_idle=300):
+        self.database = database
+        self.max_idle = max_idle
+        self._idle = queue.LifoQueue(maxsize=size)
+
+    def _connect(self):
+        return pymysql.connect(
+            host=Config.MYSQL_HOST,
+            port=int(Config.MYSQL_PORT),
+            user=Config.MYSQL_USER,
+            password=Config.MYSQL_PASSWORD,
+            database=self.database,
+            charset='utf8mb4'
+        )
+
+    def get(self):
+        """
+        Check out a connection, reusing an idle one when available.
+        """
+        while True:
+            try:
+                connection, released_at = self._idle.get_nowait()
+            except queue.Empty:
+                return self._connect()
+            if connection.open and time.monotonic() - released_at < self.max_idle:
+                return connection
+            self.discard(connection)
+
+    def release(self, connection, committed=True):
+        """
+        Return a connection to the pool.
+        Connections left mid-transaction are rolled back first and dropped if that fails.
+        """
+        if not committed:
+            try:
+                connection.rollback()
+            except pymysql.Error:
+                self.discard(connection)
+                return
+        try:
+            self._idle.put_nowait((connection, time.monotonic()))
+        except queue.Full:
+            self.discard(connection)
+
+    def discard(self, connection):
+        """
+        Close a connection that must not be reused.
+        """
+        close_quietly(connection)
+
+users_pool = ConnectionPool(Config.MYSQL_USERS_DB)
+conversations_pool = ConnectionPool(Config.MYSQL_CONVERSATIONS_DB)
+
 def init_users_db():
     """
     Initialize the users MySQL database with a users table.
     Requires MYSQL_HOST, MYSQL_PORT, MYSQL_USER, MYSQL_PASSWORD, MYSQL_USERS_DB in .env.
+    The schema is created once per process; failed attempts are retried on the next rerun.
+    Returns True if the database is ready.
     """
     # Validate environment variables
     required_vars = [
@@ -41,8 +132,20 @@ def init_users_db():
     ]
     if not all(required_vars):
         st.error("Missing MySQL configuration. Please check environment variables.", icon="❌")
-        return
+        return False
 
+    try:
+        return create_users_schema()
+    except (pymysql.Error, RuntimeError) as e:
+        st.error(f"Error initializing users database: {e}", icon="❌")
+        return False
+
+@st.cache_resource(show_spinner=False)
+def create_users_schema():
+    """
+    Create the users database and its table.
+    Cached so the DDL runs at most once per process; errors are raised and not cached.
+    """
     connection = None
     cursor = None
     try:
@@ -58,122 +161,152 @@ def init_users_db():
         cursor.execute(f"USE {Config.MYSQL_USERS_DB}")
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS users (
-                user_id VARCHAR(255) PRIMARY KEY,
+                id BIGINT UNSIGNED AUTO_INCREMENT PRIMARY KEY,
                 name VARCHAR(255) NOT NULL,
                 username VARCHAR(255) NOT NULL UNIQUE,
                 email VARCHAR(255) NOT NULL UNIQUE,
                 password VARBINARY(255) NOT NULL
             )
         """)
+        # Older schemas keyed users by a "QM{n}" user_id string; convert it to the numeric id.
+        # DDL commits implicitly, so every step checks the current layout and a migration
+        # that stopped half-way resumes on the next start
+        cursor.execute(
+            "SELECT COLUMN_NAME FROM information_schema.COLUMNS "
+            "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'users' AND COLUMN_NAME IN ('user_id', 'id')",
+            (Config.MYSQL_USERS_DB,)
+        )
+        columns = {row[0] for row in cursor.fetchall()}
+        if "user_id" in columns:
+            if "id" not in columns:
+                cursor.execute("ALTER TABLE users ADD COLUMN id BIGINT UNSIGNED NULL FIRST")
+            cursor.execute(
+                "UPDATE users SET id = IF(user_id REGEXP '^QM[0-9]+$', "
+                "CAST(SUBSTRING(user_id, 3) AS UNSIGNED), NULL)"
+            )
+            # Only swap the key once every user has a distinct, valid id
+            cursor.execute(
+                "SELECT user_id FROM users u WHERE id IS NULL OR id = 0 "
+                "OR EXISTS (SELECT 1 FROM users d WHERE d.id = u.id AND d.user_id <> u.user_id) "
+                "ORDER BY user_id LIMIT 10"
+            )
+            conflicts = [row[0] for row in cursor.fetchall()]
+            if conflicts:
+                raise RuntimeError(
+                    "cannot convert user IDs to numbers, they are not of the form QM<n> or "
+                    f"collide: {', '.join(conflicts)}. Fix them in the users table and restart."
+                )
+            cursor.execute(
+                "ALTER TABLE users DROP PRIMARY KEY, DROP COLUMN user_id, "
+                "MODIFY id BIGINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY"
+            )
         connection.commit()
-    except pymysql.Error as e:
-        st.error(f"Error initializing users database: {e}", icon="❌")
+        return True
     finally:
-        if cursor is not None:
-            cursor.close()
-        if connection is not None:
-            connection.close()
+        close_quietly(cursor)
+        close_quietly(connection)
 
 @contextmanager
 def with_users_db_cursor():
     """
     Context manager for users database cursor.
+    Connections are borrowed from users_pool.
     """
     connection = None
     cursor = None
+    committed = False
     try:
-        connection = pymysql.connect(
-            host=Config.MYSQL_HOST,
-            port=int(Config.MYSQL_PORT),
-            user=Config.MYSQL_USER,
-            password=Config.MYSQL_PASSWORD,
-            database=Config.MYSQL_USERS_DB,
-            charset='utf8mb4'
-        )
+        connection = users_pool.get()
         cursor = connection.cursor()
         yield cursor
         connection.commit()
+        committed = True
     except pymysql.Error as e:
-        if connection is not None:
-            connection.rollback()
         st.error(f"Database error: {e}", icon="❌")
         raise
     finally:
-        if cursor is not None:
-            cursor.close()
+        close_quietly(cursor)
         if connection is not None:
-            connection.close()
+            users_pool.release(connection, committed)
 
 @contextmanager
 def with_conversations_db_cursor():
     """
     Context manager for conversations database cursor.
+    Connections are borrowed from conversations_pool.
     """
     connection = None
     cursor = None
+    committed = False
     try:
-        connection = pymysql.connect(
-            host=Config.MYSQL_HOST,
-            port=int(Config.MYSQL_PORT),
-            user=Config.MYSQL_USER,
-            password=Config.MYSQL_PASSWORD,
-            database=Config.MYSQL_CONVERSATIONS_DB,
-            charset='utf8mb4'
-        )
+        connection = conversations_pool.get()
         cursor = connection.cursor()
         yield cursor
         connection.commit()
+        committed = True
     except pymysql.Error as e:
-        if connection is not None:
-            connection.rollback()
         st.error(f"Database error: {e}", icon="❌")
         raise
     finally:
-        if cursor is not None:
-            cursor.close()
+        close_quietly(cursor)
         if connection is not None:
-            connection.close()
+            conversations_pool.release(connection, committed)
+
+def format_user_id(row_id):
+    """
+    Render a users.id as the QM{n} user_id used by the app and the sessions table.
+    """
+    return f"QM{row_id}"
+
+def parse_user_id(user_id):
+    """
+    Return the users.id of a QM{n} user_id, or None if it isn't one.
+    """
+    if user_id and user_id.startswith("QM") and user_id[2:].isdigit():
+        return int(user_id[2:])
+    return None
+
+# Hashing time aimed for when calibrating the bcrypt cost, and the allowed cost range
+BCRYPT_TARGET_SECONDS = 0.25
+BCRYPT_MIN_ROUNDS = 10
+BCRYPT_MAX_ROUNDS = 16
 
-def get_next_user_id():
+@lru_cache(maxsize=1)
+def bcrypt_rounds():
     """
-    Generate the next available user_id in QM{n} format.
+    Return the bcrypt cost factor for new hashes.
+    Uses Config.BCRYPT_ROUNDS when set; otherwise times one hash at the minimum cost
+    and picks the cost closest to BCRYPT_TARGET_SECONDS (each extra round doubles the time).
+    Existing hashes keep the cost they were created with.
     """
-    with with_users_db_cursor() as cursor:
-        cursor.execute("SELECT user_id FROM users")
-        user_ids = [row[0] for row in cursor.fetchall()]
-        if not user_ids:
-            return "QM1"
-        numbers = [int(re.match(r"QM(\d+)", uid).group(1)) for uid in user_ids if re.match(r"QM(\d+)", uid)]
-        if not numbers:
-            return "QM1"
-        max_num = max(numbers)
-        for i in range(1, max_num + 2):
-            if i not in numbers:
-                return f"QM{i}"
-        return f"QM{max_num + 1}"
+    if Config.BCRYPT_ROUNDS is not None:
+        return Config.BCRYPT_ROUNDS
+    start = time.perf_counter()
+    bcrypt.hashpw(b"calibration", bcrypt.gensalt(rounds=BCRYPT_MIN_ROUNDS))
+    elapsed = max(time.perf_counter() - start, 1e-6)
+    rounds = BCRYPT_MIN_ROUNDS + round(math.log2(BCRYPT_TARGET_SECONDS / elapsed))
+    return min(max(rounds, BCRYPT_MIN_ROUNDS), BCRYPT_MAX_ROUNDS)
 
-def hash_password(password):
+def hash_password_bytes(password):
     """
-    Hash a password using bcrypt.
+    Hash an already UTF-8 encoded password using bcrypt.
     Returns bytes object for storage in VARBINARY column.
     """
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds=bcrypt_rounds()))
 
-def verify_password(password, hashed):
+@lru_cache(maxsize=1)
+def dummy_password_hash():
     """
-    Verify a password against its hash.
-    Handles hashed as bytes or string (converting string to bytes if needed).
+    Return a hash, created once at the current cost, to check passwords of unknown usernames against.
     """
-    try:
-        # Ensure hashed is bytes
-        if isinstance(hashed, str):
-            hashed = hashed.encode('utf-8')
-        elif not isinstance(hashed, bytes):
-            raise ValueError("Hashed password must be bytes or string")
-        return bcrypt.checkpw(password.encode('utf-8'), hashed)
-    except Exception as e:
-        st.error(f"Password verification error: {str(e)}", icon="❌")
-        return False
+    return bcrypt.hashpw(b"not a real password", bcrypt.gensalt(rounds=bcrypt_rounds()))
+
+def verify_password_bytes(password, hashed):
+    """
+    Verify an already UTF-8 encoded password against its bcrypt hash (bytes).
+    Raises ValueError for a malformed hash or a password longer than 72 bytes.
+    """
+    return bcrypt.checkpw(password, hashed)
 
 def register_user(name, username, email, password):
     """
@@ -185,33 +318,50 @@ def register_user(name, username, email, password):
     if not email or '@' not in email or '.' not in email:
         st.error("Please enter a valid email address.", icon="❌")
         return False
-    if len(password) < 8:
-        st.error("Password must be at least 8 characters long.", icon="❌")
-        return False
-    if not re.search(r"[A-Z]", password):
-        st.error("Password must contain at least one uppercase letter.", icon="❌")
-        return False
-    if not re.search(r"[a-z]", password):
-        st.error("Password must contain at least one lowercase letter.", icon="❌")
+    # bcrypt only accepts up to 72 bytes, which fewer characters may already exceed
+    password_bytes = password.encode('utf-8')
+    if len(password_bytes) > 72:
+        st.error("Password must be at most 72 bytes long.", icon="❌")
         return False
-    if not re.search(r"[0-9]", password):
-        st.error("Password must contain at least one digit.", icon="❌")
-        return False
-    if not re.search(r"[@#$%^&+=]", password):
-        st.error("Password must contain at least one special character (@#$%^&+=).", icon="❌")
+    # One pass for a valid password; the individual checks only run to explain a failure
+    if not _RE_PASSWORD.match(password):
+        if len(password) < 8:
+            st.error("Password must be at least 8 characters long.", icon="❌")
+        elif not _RE_UPPER.search(password):
+            st.error("Password must contain at least one uppercase letter.", icon="❌")
+        elif not _RE_LOWER.search(password):
+            st.error("Password must contain at least one lowercase letter.", icon="❌")
+        elif not _RE_DIGIT.search(password):
+            st.error("Password must contain at least one digit.", icon="❌")
+        else:
+            st.error("Password must contain at least one special character (@#$%^&+=).", icon="❌")
         return False
 
     try:
         with with_users_db_cursor() as cursor:
-            hashed_password = hash_password(password)
-            user_id = get_next_user_id()
+            # Report a taken username or email up front, before hashing and inserting
+            cursor.execute(
+                "SELECT COALESCE(SUM(username = %s), 0), COALESCE(SUM(email = %s), 0) "
+                "FROM users WHERE username = %s OR email = %s",
+                (username, email.lower(), username, email.lower())
+            )
+            username_taken, email_taken = cursor.fetchone()
+            if username_taken:
+                st.error("Username already exists. Please choose a different username.", icon="❌")
+                return False
+            if email_taken:
+                st.error("Email already exists. Please use a different email.", icon="❌")
+                return False
+            hashed_password = hash_password_bytes(password_bytes)
             cursor.execute(
-                "INSERT INTO users (user_id, name, username, email, password) VALUES (%s, %s, %s, %s, %s)",
-                (user_id, name.strip(), username, email.lower(), hashed_password)
+                "INSERT INTO users (name, username, email, password) VALUES (%s, %s, %s, %s)",
+                (name.strip(), username, email.lower(), hashed_password)
             )
             cursor.connection.commit()
+            forget_cached_user(username=username)
             return True
     except pymysql.err.IntegrityError as e:
+        # Only reached when a concurrent registration wins the race after the check above
         if "Duplicate entry" in str(e):
             if "username" in str(e):
                 st.error("Username already exists. Please choose a different username.", icon="❌")
@@ -224,26 +374,62 @@ def register_user(name, username, email, password):
         st.error(f"Database error: {str(e)}", icon="❌")
         return False
 
+# Recently looked-up user rows by lowercased username (usernames compare
+# case-insensitively in MySQL); TTLCache is not thread-safe, hence the lock
+_user_cache = TTLCache(maxsize=1024, ttl=60)
+_user_cache_lock = threading.Lock()
+
+# Cached for usernames without an account, so that unknown usernames skip the
+# database exactly like known ones and lookup times don't reveal which exist
+_UNKNOWN_USER = object()
+
+def forget_cached_user(username=None, user_id=None):
+    """
+    Drop a user's row from the login cache, by username or by user_id.
+    """
+    with _user_cache_lock:
+        if username is not None:
+            _user_cache.pop(username.lower(), None)
+        if user_id is not None:
+            row_id = parse_user_id(user_id)
+            for key in [key for key, row in _user_cache.items()
+                        if row is not _UNKNOWN_USER and row[0] == row_id]:
+                _user_cache.pop(key, None)
+
 def login_user(username, password):
     """
     Authenticate a user and return user details if successful.
     Ensures password hash is treated as bytes.
+    User rows, and the absence of one, are cached for a minute, so repeated logins skip the database.
     """
+    password_bytes = password.encode('utf-8')
     try:
-        with with_users_db_cursor() as cursor:
-            cursor.execute(
-                "SELECT user_id, name, username, email, password FROM users WHERE username = %s",
-                (username,)
-            )
-            user = cursor.fetchone()
-            if user:
-                # Ensure password hash is bytes
-                hashed = user[4]
-                if isinstance(hashed, str):
-                    hashed = hashed.encode('utf-8')
-                if verify_password(password, hashed):
-                    return {"user_id": user[0], "name": user[1], "username": user[2], "email": user[3]}
+        with _user_cache_lock:
+            user = _user_cache.get(username.lower())
+        if user is None:
+            with with_users_db_cursor() as cursor:
+                cursor.execute(
+                    "SELECT id, name, username, email, password FROM users WHERE username = %s",
+                    (username,)
+                )
+                user = cursor.fetchone()
+            with _user_cache_lock:
+                _user_cache[username.lower()] = _UNKNOWN_USER if user is None else user
+        if user is None or user is _UNKNOWN_USER:
+            # Spend the same bcrypt time as for a wrong password, so response times
+            # don't reveal which usernames exist
+            verify_password_bytes(password_bytes, dummy_password_hash())
             return None
+        # Ensure password hash is bytes
+        hashed = user[4]
+        if isinstance(hashed, str):
+            hashed = hashed.encode('utf-8')
+        if verify_password_bytes(password_bytes, hashed):
+            return {"user_id": format_user_id(user[0]), "name": user[1], "username": user[2], "email": user[3]}
+        return None
+    except ValueError:
+        # A password over bcrypt's 72-byte limit (never stored) or a malformed stored hash
+        return None
     except pymysql.Error as e:
         st.error(f"Database error: {str(e)}", icon="❌")
         return None
@@ -251,19 +437,49 @@ def login_user(username, password):
 def delete_user(user_id):
     """
     Delete a user's account and all associated chat sessions.
+    Both databases live on the same MySQL server, so one connection deletes from both
+    in a single transaction; a failure leaves neither the account nor its sessions half-deleted.
     """
     try:
         with with_users_db_cursor() as cursor:
-            cursor.execute("DELETE FROM users WHERE user_id = %s", (user_id,))
-            cursor.connection.commit()
-        with with_conversations_db_cursor() as cursor:
-            cursor.execute("DELETE FROM sessions WHERE user_id = %s", (user_id,))
-            cursor.connection.commit()
+            cursor.execute(
+                f"DELETE FROM `{Config.MYSQL_CONVERSATIONS_DB}`.sessions WHERE user_id = %s",
+                (user_id,)
+            )
+            cursor.execute("DELETE FROM users WHERE id = %s", (parse_user_id(user_id),))
+        forget_cached_user(user_id=user_id)
         return True
     except pymysql.Error as e:
         st.error(f"Database error while deleting account: {str(e)}", icon="❌")
         return False
 
+# Login page styles live in static/login.css (served at app/static/ through
+# server.enableStaticServing in .streamlit/config.toml), so the browser fetches and
+# caches them once instead of receiving them inline on every rerun. Only the page
+# background, which depends on whether the image exists, is sent inline.
+LOGIN_CSS_LINK = '<link rel="stylesheet" href="app/static/login.css">'
+
+LOGIN_BACKGROUND_CSS = """
+        <style>
+        .stApp {
+            background-image: url("app/static/background.jpg");
+            background-size: cover;
+            background-position: center;
+            background-repeat: repeat;
+            background-attachment: local;
+            min-height: 100vh;
+        }
+        </style>
+        """
+
+LOGIN_FALLBACK_BACKGROUND_CSS = """
+        <style>
+        body, .main {
+            background: linear-gradient(#1e1e1e, #2a2a2a);
+        }
+        </style>
+        """
+
 def show_login_page():
     """
     Display the login or registration page with a neon-themed UI and full-page background image.
@@ -275,229 +491,13 @@ def show_login_page():
     if "registration_success" not in st.session_state:
         st.session_state.registration_success = False
 
-    def get_base64_image(image_path):
-        with open(image_path, "rb") as img_file:
-            return base64.b64encode(img_file.read()).decode()
-    
     bg_image_path = os.path.join(os.path.dirname(__file__), "static", "background.jpg")
-    try:
-        bg_image_base64 = get_base64_image(bg_image_path)
-        st.markdown(
-            f"""
-            <style>
-            @import url('https://fonts.googleapis.com/css2?family=Orbitron:wght@400;500;700&display=swap');
-            @import url('https://fonts.googleapis.com/css2?family=Roboto:wght@500&display=swap');
-            
-            .stApp {{
-                background-image: url("data:image/jpeg;base64,{bg_image_base64}");
-                background-size: cover;
-                background-position: center;
-                background-repeat: repeat;
-                background-attachment: local;
-                min-height: 100vh;
-            }}
-            [data-testid="stHeader"] {{
-                background: rgba(0, 0, 0, 0);
-            }}
-            [data-testid="stToolbar"] {{
-                background: rgba(0, 0, 0, 0);
-            }}
-            [data-testid="stSidebar"] > div:first-child {{
-                background: rgba(0, 0, 0, 0);
-            }}
-            [data-testid="stAppViewContainer"] {{
-                background: transparent;
-            }}
-            body {{
-                font-family: 'Orbitron', 'Arial', sans-serif;
-            }}
-            section[data-testid="stSidebar"] {{
-                display: none;
-            }}
-            .main {{
-                min-height: 100vh;
-                display: flex;
-                justify-content: center;
-                align-items: center;
-                padding: 2rem;
-            }}
-            .section-header {{
-                color: #ff69b4;
-                text-shadow: 0 0 6px #ff69b4, 0 0 12px #ffb6c1;
-                font-size: 2rem;
-                text-align: center;
-                margin-bottom: 1.5rem;
-            }}
-            input[data-testid="stTextInput"] {{
-                border-radius: 8px !important;
-                border: 2px solid #39ffa2 !important;
-                background: rgba(255, 255, 255, 0.1) !important;
-                color: #d2f5d0 !important;
-                font-family: 'Roboto', sans-serif !important;
-                padding: 0.5rem !important;
-                margin-bottom: 1rem !important;
-            }}
-            input[data-testid="stTextInput"]:focus {{
-                box-shadow: 0 0 10px #39ffa2, 0 0 20px #39ffa2 !important;
-            }}
-            button[kind="primary"] {{
-                background-color: #39ffa2 !important;
-                color: #1e1e1e !important;
-                font-family: 'Orbitron', sans-serif !important;
-                border-radius: 8px !important;
-                border: none !important;
-                padding: 0.5rem 1rem !important;
-                transition: all 0.3s ease !important;
-                display: block !important;
-                margin: 1rem auto !important;
-                width: 200px !important;
-            }}
-            button[kind="primary"]:hover {{
-                box-shadow: 0 0 15px #39ffa2, 0 0 30px #39ffa2 !important;
-                transform: scale(1.05) !important;
-            }}
-            button[kind="secondary"] {{
-                background-color: transparent !important;
-                border: 2px solid #ff69b4 !important;
-                color: #ff69b4 !important;
-                font-family: 'Orbitron', sans-serif !important;
-                border-radius: 8px !important;
-                padding: 0.5rem 1rem !important;
-                transition: all 0.3s ease !important;
-                width: 200px !important;
-            }}
-            button[kind="secondary"]:hover {{
-                box-shadow: 0 0 15px #ff69b4, 0 0 30px #ff69b4 !important;
-                transform: scale(1.05) !important;
-            }}
-            .button-container {{
-                display: flex;
-                justify-content: flex-start;
-                gap: 0.5rem;
-                margin-top: 1rem;
-                padding-left: 1rem;
-            }}
-            div[data-testid="stAlert"] p {{
-                font-family: 'Orbitron', sans-serif !important;
-                font-weight: 500;
-                font-size: 1rem;
-            }}
-            .stTextInput {{
-                margin: 0 auto;
-                width: 300px;
-            }}
-            .success-message {{
-                font-family: 'Orbitron', sans-serif;
-                color: yellow;
-                text-shadow: 0 0 6px #ff69b4, 0 0 12px #ffb6c1;
-                font-size: 2rem;
-                text-align: center;
-                margin-bottom: 1.5rem;
-            }}
-            </style>
-            """,
-            unsafe_allow_html=True
-        )
-    except FileNotFoundError:
+    st.markdown(LOGIN_CSS_LINK, unsafe_allow_html=True)
+    if os.path.exists(bg_image_path):
+        st.markdown(LOGIN_BACKGROUND_CSS, unsafe_allow_html=True)
+    else:
         st.warning("Background image not found at static/background.jpg. Please ensure the file exists.", icon="⚠️")
-        st.markdown(
-            """
-            <style>
-            @import url('https://fonts.googleapis.com/css2?family=Orbitron:wght@400;500;700&display=swap');
-            @import url('https://fonts.googleapis.com/css2?family=Roboto:wght@500&display=swap');
-            
-            body {{
-                background: linear-gradient(#1e1e1e, #2a2a2a);
-                font-family: 'Orbitron', 'Arial', sans-serif;
-            }}
-            section[data-testid="stSidebar"] {{
-                display: none;
-            }}
-            .main {{
-                background: linear-gradient(#1e1e1e, #2a2a2a);
-                min-height: 100vh;
-                display: flex;
-                justify-content: center;
-                align-items: center;
-                padding: 2rem;
-            }}
-            .section-header {{
-                color: #ff69b4;
-                text-shadow: 0 0 6px #ff69b4, 0 0 12px #ffb6c1;
-                font-size: 2rem;
-                text-align: center;
-                margin-bottom: 1.5rem;
-            }}
-            input[data-testid="stTextInput"] {{
-                border-radius: 8px !important;
-                border: 2px solid #39ffa2 !important;
-                background: rgba(255, 255, 255, 0.1) !important;
-                color: #d2f5d0 !important;
-                font-family: 'Roboto', sans-serif !important;
-                padding: 0.5rem !important;
-                margin-bottom: 1rem !important;
-            }}
-            input[data-testid="stTextInput"]:focus {{
-                box-shadow: 0 0 10px #39ffa2, 0 0 20px #39ffa2 !important;
-            }}
-            button[kind="primary"] {{
-                background-color: #39ffa2 !important;
-                color: #1e1e1e !important;
-                font-family: 'Orbitron', sans-serif !important;
-                border-radius: 8px !important;
-                border: none !important;
-                padding: 0.5rem 1rem !important;
-                transition: all 0.3s ease !important;
-                display: block !important;
-                margin: 1rem auto !important;
-                width: 200px !important;
-            }}
-            button[kind="primary"]:hover {{
-                box-shadow: 0 0 15px #39ffa2, 0 0 30px #39ffa2 !important;
-                transform: scale(1.05) !important;
-            }}
-            button[kind="secondary"] {{
-                background-color: transparent !important;
-                border: 2px solid #ff69b4 !important;
-                color: #ff69b4 !important;
-                font-family: 'Orbitron', sans-serif !important;
-                border-radius: 8px !important;
-                padding: 0.5rem 1rem !important;
-                transition: all 0.3s ease !important;
-                width: 200px !important;
-            }}
-            button[kind="secondary"]:hover {{
-                box-shadow: 0 0 15px #ff69b4, 0 0 30px #ff69b4 !important;
-                transform: scale(1.05) !important;
-            }}
-            .button-container {{
-                display: flex;
-                justify-content: flex-start;
-                gap: 0.5rem;
-                margin-top: 1rem;
-                padding-left: 1rem;
-            }}
-            div[data-testid="stAlert"] p {{
-                font-family: 'Orbitron', sans-serif !important;
-                font-weight: 500;
-                font-size: 1rem;
-            }}
-            .stTextInput {{
-                margin: 0 auto;
-                width: 300px;
-            }}
-            .success-message {{
-                font-family: 'Orbitron', sans-serif;
-                color: yellow;
-                text-shadow: 0 0 6px #ff69b4, 0 0 12px #ffb6c1;
-                font-size: 2rem;
-                text-align: center;
-                margin-bottom: 1.5rem;
-            }}
-            </style>
-            """,
-            unsafe_allow_html=True
-        )
+        st.markdown(LOGIN_FALLBACK_BACKGROUND_CSS, unsafe_allow_html=True)
 
     with st.container():
         st.markdown("""
@@ -592,8 +592,7 @@ def logout():
     Log out the current user and reset session state with a loading state.
     """
     with st.spinner("Logging out..."):
-        for key in list(st.session_state.keys()):
-            del st.session_state[key]
+        st.session_state.clear()
         st.session_state.authenticated = False
         st.session_state.force_login_page = True
         st.rerun()
@@ -8,15 +8,54 @@
 
 
 
+import asyncio
 import os
 import sys
 from pathlib import Path
 
 # Local application imports
+# LangChain and prompt_toolkit are imported in main() once the arguments are
+# validated, so a usage error exits without paying for them
 from Querymind.config import Config
-from Querymind.models import create_llm
-from Querymind.tools import get_available_tools
-from Querymind.agent import ask, create_history
+
+# Queries typed in earlier sessions, recalled with the arrow keys
+HISTORY_PATH = Path.home() / ".qm_history"
+
+async def repl(llm, history):
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.history import FileHistory
+    from Querymind.agent import STREAM_RESET, ask_stream_async
+    
+    session = PromptSession(history=FileHistory(str(HISTORY_PATH)))
+    
+    while True:
+        # Get user query
+        try:
+            query = await session.prompt_async("\n🧐 Enter your query (or 'exit' to quit): ")
+        except EOFError:
+            query = "exit"
+        
+        if query.lower() in ('exit', 'quit'):
+            print("Goodbye! 👋")
+            break
+        
+        if not query.strip():
+            continue
+            
+        print("\n🤖 Response:")
+        
+        # Process the query, printing the answer as it is generated
+        try:
+            async for chunk in ask_stream_async(query, history, llm):
+                if chunk is STREAM_RESET:
+                    # What was printed was the model's commentary before a tool call;
+                    # it can't be taken back from the terminal, so start a new line
+                    chunk = "\n"
+                sys.stdout.write(chunk)
+                sys.stdout.flush()
+            print()
+        except Exception as e:
+            print(f"\n❌ Error: {str(e)}")
 
 def main():
     # Check if database path was provided
@@ -33,32 +72,18 @@ def main():
     Config.Path.DATABASE_PATH = db_path
     print(f"Connected to database: {db_path}")
     
+    from Querymind.models import create_llm
+    from Querymind.agent import create_history
+    
     # Initialize the model
     llm = create_llm(Config.MODEL)
-    llm = llm.bind_tools(get_available_tools())
     
     # Create history with system prompt
     history = create_history()
     
     # Interactive loop
     try:
-        while True:
-            # Get user query
-            query = input("\n🧐 Enter your query (or 'exit' to quit): ")
-            
-            if query.lower() in ('exit', 'quit'):
-                print("Goodbye! 👋")
-                break
-                
-            print("\n🤖 Processing...")
-            
-            # Process the query
-            try:
-                response = ask(query, history, llm)
-                print(f"\n🤖 Response:\n{response}")
-            except Exception as e:
-                print(f"\n❌ Error: {str(e)}")
-    
+        asyncio.run(repl(llm, history))
     except KeyboardInterrupt:
         print("\nGoodbye! 👋")
 